@@ -0,0 +1,382 @@
+from argparse import ArgumentParser
+import json
+from random import Random
+import subprocess
+import sys
+import time
+from tkinter import TclError
+import tracemalloc
+
+from models import (
+    EventSimulationEngine,
+    PlaneTypes,
+    Schedule,
+    SimulationEngine,
+)
+
+
+# столбцы таблицы результатов
+COLUMNS = (
+    'case',
+    'flights',
+    'runways',
+    'seconds',
+    'flights_per_second',
+    'ticks_per_second',
+    'peak_memory_mb',
+)
+
+
+def create_schedule(plane_types, flights_count, seed):
+    """Создает синтетическое расписание с равномерным временем рейсов."""
+    rng = Random(seed)
+    type_names = list(plane_types.get_plane_types())
+    flight_schedule = Schedule()
+    flight_schedule.set_flights([
+        (
+            rng.choice(type_names),
+            rng.choice(('взлет', 'посадка')),
+            (rng.randrange(24), rng.randrange(60)),
+        )
+        for _ in range(flights_count)
+    ])
+    return flight_schedule
+
+
+def run_engine(
+    engine_class,
+    plane_types,
+    flight_schedule,
+    runway_count,
+    time_tick,
+    read_state=False,
+    **engine_options,
+):
+    """Моделирует сутки без интерфейса.
+
+    Возвращает кол-во смоделированных рейсов (поступивших заявок) и
+    шагов: от них, в отличие от обслуженных заявок, не зависит,
+    хватает ли полос на все рейсы.
+
+    Если задан read_state, после каждого шага читаются статистика и
+    изменения списка совершенных рейсов, как при отрисовке в GUI.
+    """
+    engine = engine_class(
+        plane_types,
+        flight_schedule,
+        runway_count,
+        1,
+        (0, 120),
+        time_tick,
+        (0, 0),
+        seed=0,
+        **engine_options,
+    )
+    if read_state:
+        while engine.step():
+            engine.get_stats()
+            engine.read_finished_flights()
+    else:
+        engine.run_to_end()
+    return get_simulated_counts(engine)
+
+
+def get_simulated_counts(engine):
+    """Возвращает кол-во смоделированных рейсов и шагов движка."""
+    return (
+        engine.airport.request_store.get_requests_count(),
+        engine.passed_time_ticks,
+    )
+
+
+def run_step(plane_types, flight_schedule, runway_count, time_tick):
+    """Пошаговый движок."""
+    return run_engine(
+        SimulationEngine,
+        plane_types,
+        flight_schedule,
+        runway_count,
+        time_tick,
+    )
+
+
+def run_step_bank(plane_types, flight_schedule, runway_count, time_tick):
+    """Пошаговый движок с полосами в массивах numpy."""
+    return run_engine(
+        SimulationEngine,
+        plane_types,
+        flight_schedule,
+        runway_count,
+        time_tick,
+        runway_bank=True,
+    )
+
+
+def run_event(plane_types, flight_schedule, runway_count, time_tick):
+    """Событийный движок."""
+    return run_engine(
+        EventSimulationEngine,
+        plane_types,
+        flight_schedule,
+        runway_count,
+        time_tick,
+    )
+
+
+def run_step_state(plane_types, flight_schedule, runway_count, time_tick):
+    """Пошаговый движок с чтением состояния модели на каждом шаге."""
+    return run_engine(
+        SimulationEngine,
+        plane_types,
+        flight_schedule,
+        runway_count,
+        time_tick,
+        read_state=True,
+    )
+
+
+def run_gui(plane_types, flight_schedule, runway_count, time_tick):
+    """Пошаговое моделирование с отрисовкой в скрытом окне диспетчера."""
+    from gui import Dispatcher
+
+    dispatcher = Dispatcher(run_mainloop=False)
+    try:
+        dispatcher.root.withdraw()
+        dispatcher.plane_preparation_time = plane_types
+        dispatcher.flight_schedule = flight_schedule
+        dispatcher.runway_count_var.set(runway_count)
+        dispatcher.model_step_var.set(time_tick)
+        dispatcher.start_modeling()
+        while not dispatcher.engine.is_finished():
+            dispatcher.time_step()
+            dispatcher.root.update_idletasks()
+        return get_simulated_counts(dispatcher.engine)
+    finally:
+        dispatcher.root.destroy()
+
+
+# замеряемые сценарии
+CASES = {
+    'step': run_step,
+    'step_bank': run_step_bank,
+    'event': run_event,
+    'step_state': run_step_state,
+    'gui': run_gui,
+}
+
+
+def measure(
+    case,
+    plane_types,
+    flight_schedule,
+    runway_count,
+    time_tick,
+    memory=True,
+    repeat=1,
+):
+    """Замеряет время, пропускную способность и пиковую память сценария.
+
+    Время - лучшее из repeat прогонов. Память замеряется отдельным
+    прогоном: tracemalloc замедляет работу и исказил бы время.
+    """
+    case_function = CASES[case]
+    seconds = None
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        flights_count, ticks_count = case_function(
+            plane_types,
+            flight_schedule,
+            runway_count,
+            time_tick,
+        )
+        run_seconds = time.perf_counter() - start_time
+        if seconds is None or run_seconds < seconds:
+            seconds = run_seconds
+
+    peak_memory_mb = None
+    if memory:
+        tracemalloc.start()
+        try:
+            case_function(
+                plane_types,
+                flight_schedule,
+                runway_count,
+                time_tick,
+            )
+            peak_memory_mb = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        finally:
+            tracemalloc.stop()
+    return {
+        'case': case,
+        'flights': len(flight_schedule.get_schedule()),
+        'runways': runway_count,
+        'seconds': round(seconds, 4),
+        'flights_per_second': round(flights_count / seconds),
+        'ticks_per_second': round(ticks_count / seconds),
+        'peak_memory_mb': (
+            None if peak_memory_mb is None else round(peak_memory_mb, 2)
+        ),
+    }
+
+
+def run_benchmarks(
+    cases,
+    flight_counts,
+    runway_counts,
+    time_tick=5,
+    seed=0,
+    memory=True,
+    repeat=1,
+):
+    """Замеряет сценарии на всех сочетаниях размеров задачи.
+
+    Результаты отдаются по мере готовности; сценарии, которые нельзя
+    выполнить в текущем окружении (нет numpy или дисплея), пропускаются.
+    """
+    plane_types = PlaneTypes()
+    plane_types.use_default_settings()
+    for flights_count in flight_counts:
+        flight_schedule = create_schedule(plane_types, flights_count, seed)
+        for runway_count in runway_counts:
+            for case in cases:
+                try:
+                    yield measure(
+                        case,
+                        plane_types,
+                        flight_schedule,
+                        runway_count,
+                        time_tick,
+                        memory,
+                        repeat,
+                    )
+                except (ImportError, TclError) as error:
+                    print(f'{case}: пропущен ({error})', file=sys.stderr)
+
+
+def get_revision():
+    """Возвращает текущий коммит git или None.
+
+    Если отслеживаемые файлы изменены после коммита, к нему добавляется
+    -dirty: замеры относятся не к коммиту, а к незакоммиченному коду.
+    """
+    try:
+        revision = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+        changes = subprocess.run(
+            ['git', 'status', '--porcelain', '--untracked-files=no'],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f'{revision}-dirty' if changes.strip() else revision
+
+
+def compare_results(results, previous_results):
+    """Печатает отношение пропускной способности к прошлым замерам."""
+    previous = {
+        (result['case'], result['flights'], result['runways']): result
+        for result in previous_results
+    }
+    for result in results:
+        key = (result['case'], result['flights'], result['runways'])
+        if key not in previous:
+            continue
+        ratio = (
+            result['flights_per_second']
+            / max(1, previous[key]['flights_per_second'])
+        )
+        print(f'{key[0]} {key[1]}x{key[2]}: {ratio:.2f}x')
+
+
+def main():
+    """Запуск замеров из командной строки."""
+    parser = ArgumentParser(description='Замеры производительности модели.')
+    parser.add_argument(
+        '--cases',
+        nargs='+',
+        choices=list(CASES),
+        default=list(CASES),
+    )
+    parser.add_argument(
+        '--flights',
+        type=int,
+        nargs='+',
+        default=[100, 10000, 100000, 1000000],
+    )
+    parser.add_argument(
+        '--runways',
+        type=int,
+        nargs='+',
+        default=[2, 50, 500],
+    )
+    parser.add_argument('--step', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=3,
+        help='кол-во прогонов для замера времени',
+    )
+    parser.add_argument(
+        '--no-memory',
+        action='store_true',
+        help='не замерять пиковую память',
+    )
+    parser.add_argument(
+        '--output',
+        default=None,
+        help='файл JSON для результатов (хранится в git)',
+    )
+    parser.add_argument(
+        '--compare',
+        default=None,
+        help='файл JSON с прошлыми результатами для сравнения',
+    )
+    args = parser.parse_args()
+    # коммит запоминается до замеров: код мог измениться за время прогона
+    revision = get_revision()
+
+    print('\t'.join(COLUMNS))
+    results = []
+    for result in run_benchmarks(
+        args.cases,
+        args.flights,
+        args.runways,
+        time_tick=args.step,
+        seed=args.seed,
+        memory=not args.no_memory,
+        repeat=args.repeat,
+    ):
+        results.append(result)
+        print('\t'.join(str(result[column]) for column in COLUMNS))
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as previous_file:
+            compare_results(results, json.load(previous_file)['results'])
+    if args.output:
+        # по одному замеру на строку, чтобы изменения были видны в diff
+        header = {
+            'revision': revision,
+            'python': sys.version.split()[0],
+            'time_tick': args.step,
+            'repeat': args.repeat,
+        }
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            output_file.write('{\n')
+            for key, value in header.items():
+                output_file.write(f'"{key}": {json.dumps(value)},\n')
+            output_file.write('"results": [\n')
+            output_file.write(',\n'.join(
+                json.dumps(result) for result in results
+            ))
+            output_file.write('\n]}\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,232 @@
+from argparse import ArgumentParser
+from math import isclose
+from random import Random
+import sys
+
+from benchmark import create_schedule
+from models import (
+    BatchSimulationEngine,
+    EventSimulationEngine,
+    PlaneTypes,
+    SimulationEngine,
+    numpy,
+)
+
+
+# сравниваемые движки: (имя, класс движка, параметры движка);
+# эталон - первый, пошаговый движок
+ENGINES = (
+    ('step', SimulationEngine, {}),
+    ('event', EventSimulationEngine, {}),
+    ('step_bank', SimulationEngine, {'runway_bank': True}),
+    ('event_bank', EventSimulationEngine, {'runway_bank': True}),
+)
+
+
+class ReplayedRandom:
+    """Генератор numpy, отдающий заранее полученные числа одного прогона."""
+
+    def __init__(self, normal_values, integer_values):
+        self.normal_values = normal_values
+        self.integer_values = integer_values
+
+    def standard_normal(self, size):
+        """Возвращает нормальные отклонения прогона."""
+        return self.normal_values
+
+    def integers(self, low, high, size):
+        """Возвращает знаки отклонений прогона."""
+        return self.integer_values
+
+
+class ReplicationEngine(SimulationEngine):
+    """Пошаговый движок с отклонениями одного прогона BatchSimulationEngine.
+
+    BatchSimulationEngine генерирует отклонения всех прогонов сразу,
+    так же, как SimulationEngine.create_true_schedule_vectorized для
+    одного; движок получает строку этих отклонений вместо своих.
+    """
+
+    def __init__(self, replayed_rng, *args, **kwargs):
+        self.replayed_rng = replayed_rng
+        super().__init__(*args, vectorized=True, **kwargs)
+
+    def create_true_schedule_vectorized(self):
+        """Создает расписание суток из отклонений прогона."""
+        self.numpy_rng = self.replayed_rng
+        return super().create_true_schedule_vectorized()
+
+
+def create_config(rng, plane_types):
+    """Создает случайные параметры моделирования."""
+    flight_schedule = create_schedule(
+        plane_types,
+        rng.choice((1, 10, 100, 300)),
+        rng.randrange(2 ** 32),
+    )
+    return {
+        'plane_preparation_time': plane_types,
+        'flight_schedule': flight_schedule,
+        'runway_count': rng.randint(1, 6),
+        'safety_time_gap': rng.randint(0, 15),
+        'schedule_variance': (rng.randint(-60, 0), rng.randint(0, 120)),
+        'time_tick': rng.choice((1, 2, 5, 7, 15)),
+        'start_time': (rng.randrange(24), rng.randrange(60)),
+    }
+
+
+def get_state(engine):
+    """Возвращает статистику и строки таблицы совершенных рейсов."""
+    return engine.get_stats(), [
+        engine.get_finished_flight(index)
+        for index in range(engine.get_finished_flights_count())
+    ]
+
+
+def compare_engines(config, days, seed):
+    """Сравнивает движки с пошаговым в середине и в конце моделирования.
+
+    Возвращает список описаний расхождений.
+    """
+    engines = [
+        (name, engine_class(**config, seed=seed, days=days, **options))
+        for name, engine_class, options in ENGINES
+        if numpy is not None or not options.get('runway_bank')
+    ]
+    mismatches = []
+    for end_time in (days * 24 * 60 // 2, None):
+        states = []
+        for name, engine in engines:
+            if end_time is None:
+                engine.run_to_end()
+            else:
+                engine.run_until(end_time)
+            states.append((name, get_state(engine)))
+        reference_stats, reference_flights = states[0][1]
+        for name, (stats, flights) in states[1:]:
+            for key in reference_stats:
+                if stats[key] != reference_stats[key]:
+                    mismatches.append(f'{name}: {key} (время {end_time})')
+            if flights != reference_flights:
+                mismatches.append(f'{name}: рейсы (время {end_time})')
+    return mismatches
+
+
+def is_equal(value, batch_value):
+    """Сравнивает значение пошагового движка со значением прогона."""
+    if isinstance(value, list):
+        return len(value) == len(batch_value) and all(
+            isclose(item, batch_item)
+            for item, batch_item in zip(value, batch_value)
+        )
+    return isclose(value, batch_value)
+
+
+def compare_batch_engine(config, seed, replications_count):
+    """Сравнивает прогоны BatchSimulationEngine с пошаговым движком.
+
+    Возвращает список описаний расхождений.
+    """
+    batch_engine = BatchSimulationEngine(
+        config['plane_preparation_time'],
+        config['flight_schedule'],
+        config['runway_count'],
+        config['safety_time_gap'],
+        config['schedule_variance'],
+        config['time_tick'],
+        config['start_time'],
+        replications_count,
+        seed=seed,
+    )
+    batch_engine.run_to_end()
+    batch_stats = batch_engine.get_stats()
+
+    # отклонения прогонов в том порядке, в каком их генерирует пакет
+    rng = numpy.random.default_rng(seed)
+    flights_count = len(config['flight_schedule'].get_schedule())
+    shape = (replications_count, flights_count)
+    normal_values = rng.standard_normal(shape)
+    integer_values = rng.integers(0, 2, size=shape)
+
+    mismatches = []
+    for replication in range(replications_count):
+        engine = ReplicationEngine(
+            ReplayedRandom(
+                normal_values[replication],
+                integer_values[replication],
+            ),
+            **config,
+        )
+        engine.run_to_end()
+        stats = engine.get_stats()
+        for key, values in batch_stats.items():
+            if not is_equal(stats[key], values[replication].tolist()):
+                mismatches.append(f'batch[{replication}]: {key}')
+    return mismatches
+
+
+def run_checks(configs_count, seed=0, replications_count=4):
+    """Сравнивает движки на случайных параметрах и расписаниях.
+
+    Расхождения отдаются по мере обнаружения: (номер набора
+    параметров, описание).
+    """
+    plane_types = PlaneTypes()
+    plane_types.use_default_settings()
+    rng = Random(seed)
+    for config_index in range(configs_count):
+        config = create_config(rng, plane_types)
+        engine_seed = rng.randrange(2 ** 32)
+        days = rng.choice((1, 1, 2, 3))
+        for mismatch in compare_engines(config, days, engine_seed):
+            yield config_index, mismatch
+        if numpy is None:
+            continue
+        for mismatch in compare_batch_engine(
+            config,
+            engine_seed,
+            replications_count,
+        ):
+            yield config_index, mismatch
+
+
+def main():
+    """Запуск проверки из командной строки."""
+    parser = ArgumentParser(
+        description='Проверка совпадения результатов движков моделирования.',
+    )
+    parser.add_argument(
+        '--configs',
+        type=int,
+        default=100,
+        help='кол-во случайных наборов параметров',
+    )
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--replications',
+        type=int,
+        default=4,
+        help='кол-во прогонов BatchSimulationEngine',
+    )
+    args = parser.parse_args()
+
+    if numpy is None:
+        print(
+            'numpy не установлен: RunwayBank и BatchSimulationEngine '
+            'не проверяются',
+            file=sys.stderr,
+        )
+    mismatches_count = 0
+    for config_index, mismatch in run_checks(
+        args.configs,
+        seed=args.seed,
+        replications_count=args.replications,
+    ):
+        mismatches_count += 1
+        print(f'набор {config_index}: {mismatch}')
+    print(f'наборов: {args.configs}, расхождений: {mismatches_count}')
+    sys.exit(1 if mismatches_count else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,18 +1,27 @@
-from random import gauss, randint
+from contextlib import nullcontext
+from math import ceil, sqrt
+from queue import Empty, SimpleQueue
+from threading import Event, RLock, Thread
 import time
 
 from tkinter import (
+    BooleanVar,
+    Canvas,
+    DoubleVar,
+    TclError,
     IntVar,
     StringVar,
     PhotoImage,
     Tk,
     Toplevel,
+    filedialog,
     ttk,
 )
 from tkinter import (
     BOTTOM,
     CENTER,
     END,
+    HORIZONTAL,
     LEFT,
     N,
     NS,
@@ -22,7 +31,254 @@ from tkinter import (
     VERTICAL,
 )
 
-from models import Airport, PlaneTypes, Request, Schedule
+from models import PlaneTypes, Schedule, SimulationEngine, parse_clock_time
+from profiling import PhaseProfiler, profile_call
+
+
+class VirtualTable(ttk.Frame):
+    """Таблица, выводящая только видимые строки.
+
+    Данные остаются в модели: таблица получает кол-во строк и значения
+    строки по номеру через get_row_count и get_row. Элементы Treeview
+    создаются только для видимых строк (с небольшим запасом) и при
+    прокрутке переиспользуются, поэтому размер данных не влияет на
+    скорость интерфейса. Если данные меняются в другом потоке, lock
+    удерживается на все чтение строк, чтобы кол-во строк и сами строки
+    были согласованы.
+    """
+
+    def __init__(
+        self,
+        master,
+        columns,
+        headings,
+        get_row_count,
+        get_row,
+        column_width=None,
+        lock=None,
+    ):
+        super().__init__(master, borderwidth=0)
+        self.get_row_count = get_row_count
+        self.get_row = get_row
+        self.lock = lock or nullcontext()
+        # номер первой выводимой строки данных
+        self.first_row_index = 0
+        # кол-во видимых строк и запас строк сверх них
+        self.visible_rows_count = 10
+        self.buffer_rows_count = 2
+        # кол-во строк, прокручиваемых колесом мыши
+        self.wheel_rows_count = 3
+        # id переиспользуемых элементов Treeview и выведенные в них значения
+        self.row_items = []
+        self.rendered_rows = []
+        self.row_height = int(
+            ttk.Style().lookup('Treeview', 'rowheight') or 20
+        )
+
+        self.table = ttk.Treeview(self, columns=columns, show="headings")
+        for i in range(len(columns)):
+            self.table.heading(columns[i], text=headings[i])
+            self.table.column(f'#{i + 1}', stretch=True, anchor=CENTER)
+            if column_width:
+                self.table.column(f'#{i + 1}', width=column_width)
+        self.scrollbar = ttk.Scrollbar(
+            self,
+            orient=VERTICAL,
+            command=self.yview,
+        )
+        self.rowconfigure(index=0, weight=1)
+        self.columnconfigure(index=0, weight=1)
+        self.table.grid(row=0, column=0, sticky=NSEW)
+        self.scrollbar.grid(row=0, column=1, sticky=NS)
+
+        self.table.bind('<Configure>', lambda event: self.resize(event.height))
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.table.bind(sequence, self.scroll_by_wheel)
+        self.resize_pool()
+
+    def resize(self, height):
+        """Подбирает кол-во строк под высоту таблицы."""
+        # одна строка занята заголовком
+        visible_rows_count = max(1, height // self.row_height - 1)
+        if visible_rows_count != self.visible_rows_count:
+            self.visible_rows_count = visible_rows_count
+            self.resize_pool()
+
+    def resize_pool(self):
+        """Создает или удаляет элементы Treeview под видимые строки."""
+        rows_count = self.visible_rows_count + self.buffer_rows_count
+        while len(self.row_items) < rows_count:
+            self.row_items.append(self.table.insert("", END, values=()))
+            self.rendered_rows.append(())
+        if len(self.row_items) > rows_count:
+            self.table.delete(*self.row_items[rows_count:])
+            del self.row_items[rows_count:]
+            del self.rendered_rows[rows_count:]
+        self.refresh()
+
+    def refresh(self):
+        """Выводит строки данных, попадающие в видимую часть таблицы."""
+        with self.lock:
+            row_count = self.get_row_count()
+            self.first_row_index = max(
+                0,
+                min(
+                    self.first_row_index,
+                    row_count - self.visible_rows_count,
+                ),
+            )
+            rows = [
+                self.get_row(row_index)
+                for row_index in range(
+                    self.first_row_index,
+                    min(
+                        row_count,
+                        self.first_row_index + len(self.row_items),
+                    ),
+                )
+            ]
+        rows += [()] * (len(self.row_items) - len(rows))
+        for i, row in enumerate(rows):
+            # меняем только строки, значения которых изменились
+            if self.rendered_rows[i] != row:
+                self.rendered_rows[i] = row
+                self.table.item(self.row_items[i], values=row)
+        if row_count:
+            self.scrollbar.set(
+                self.first_row_index / row_count,
+                min(
+                    1,
+                    (self.first_row_index + self.visible_rows_count)
+                    / row_count,
+                ),
+            )
+        else:
+            self.scrollbar.set(0, 1)
+
+    def scroll_to(self, row_index):
+        """Прокручивает таблицу так, чтобы строка оказалась первой."""
+        self.first_row_index = row_index
+        self.refresh()
+
+    def scroll_to_end(self):
+        """Прокручивает таблицу к последним строкам."""
+        self.scroll_to(self.get_row_count())
+
+    def yview(self, *args):
+        """Обрабатывает команды полосы прокрутки."""
+        if args[0] == 'moveto':
+            self.first_row_index = int(float(args[1]) * self.get_row_count())
+        elif args[0] == 'scroll':
+            scrolled_rows_count = int(args[1])
+            if args[2] == 'pages':
+                scrolled_rows_count *= self.visible_rows_count
+            self.first_row_index += scrolled_rows_count
+        self.refresh()
+
+    def scroll_by_wheel(self, event):
+        """Прокручивает таблицу колесом мыши."""
+        if event.num == 4 or event.delta > 0:
+            self.first_row_index -= self.wheel_rows_count
+        else:
+            self.first_row_index += self.wheel_rows_count
+        self.refresh()
+        # внутренняя прокрутка Treeview не нужна
+        return 'break'
+
+
+class RunwayGrid(Canvas):
+    """Сетка состояний полос: одна цветная клетка на полосу.
+
+    Клетки создаются один раз при задании кол-ва полос и подбираются по
+    размеру так, чтобы сетка помещалась в заданную область; на каждом
+    шаге перекрашиваются только полосы, состояние которых изменилось.
+    """
+
+    def __init__(self, master, hover_var, width=400, max_height=120):
+        super().__init__(
+            master,
+            width=width,
+            height=0,
+            highlightthickness=0,
+        )
+        # строка с состоянием полосы под курсором
+        self.hover_var = hover_var
+        self.grid_width = width
+        self.max_height = max_height
+        # размер клетки с промежутком и кол-во клеток в ряду
+        self.cell_step = 16
+        self.columns_count = 1
+        # цвета и названия состояний полос
+        self.status_colors = {'free': '#2E7D32', 'busy': '#B71C1C'}
+        self.status_names = {'free': 'свободна', 'busy': 'занята'}
+        # id клеток и выведенные состояния полос
+        self.cells = []
+        self.rendered_statuses = []
+
+        self.bind('<Motion>', self.show_hover_status)
+        self.bind('<Leave>', lambda event: self.hover_var.set(''))
+
+    def set_runway_count(self, runway_count):
+        """Создает клетки для указанного кол-ва полос."""
+        self.delete('all')
+        self.cells = []
+        self.rendered_statuses = []
+        if not runway_count:
+            self.configure(height=0)
+            return
+        # клетки уменьшаются, пока сетка не поместится по высоте
+        self.cell_step = max(
+            4,
+            min(
+                16,
+                int(sqrt(self.grid_width * self.max_height / runway_count)),
+            ),
+        )
+        self.columns_count = max(1, self.grid_width // self.cell_step)
+        rows_count = ceil(runway_count / self.columns_count)
+        self.configure(height=rows_count * self.cell_step)
+        cell_size = max(1, self.cell_step - 2)
+        for i in range(runway_count):
+            x = i % self.columns_count * self.cell_step
+            y = i // self.columns_count * self.cell_step
+            self.cells.append(self.create_rectangle(
+                x,
+                y,
+                x + cell_size,
+                y + cell_size,
+                fill='#9E9E9E',
+                width=0,
+            ))
+            self.rendered_statuses.append(None)
+
+    def render_statuses(self, runway_statuses):
+        """Перекрашивает клетки полос, состояние которых изменилось."""
+        for i in range(len(runway_statuses)):
+            runway_status = runway_statuses[i]
+            if self.rendered_statuses[i] == runway_status:
+                continue
+            self.rendered_statuses[i] = runway_status
+            self.itemconfigure(
+                self.cells[i],
+                fill=self.status_colors[runway_status],
+            )
+
+    def show_hover_status(self, event):
+        """Выводит номер и состояние полосы под курсором."""
+        column = event.x // self.cell_step
+        runway_index = (
+            event.y // self.cell_step * self.columns_count + column
+        )
+        if column >= self.columns_count or not (
+            0 <= runway_index < len(self.cells)
+        ):
+            self.hover_var.set('')
+            return
+        runway_status = self.rendered_statuses[runway_index]
+        self.hover_var.set(
+            f'полоса {runway_index}: '
+            f'{self.status_names.get(runway_status, "нет данных")}'
+        )
 
 
 class PlaneTypesWindow(Toplevel):
@@ -50,37 +306,20 @@ class PlaneTypesWindow(Toplevel):
         self.landing_time_var = IntVar(value=15)
 
         # определение элементов окна
-        self.plane_types_table = ttk.Treeview(
-            self,
-            columns=("type", "takeoff", "landing"),
-            show="headings",
-        )
-        self.plane_types_table.heading("type", text="тип самолета")
-        self.plane_types_table.heading(
-            "takeoff",
-            text="время взлета (в минутах)",
-        )
-        self.plane_types_table.heading(
-            "landing",
-            text="время посадки (в минутах)",
-        )
-        self.plane_types_table.column("#1", stretch=True, anchor=CENTER)
-        self.plane_types_table.column("#2", stretch=True, anchor=CENTER)
-        self.plane_types_table.column("#3", stretch=True, anchor=CENTER)
-        data = self.plane_types.get_plane_types()
-        for plane_type in data:
-            element = (plane_type, data[plane_type][0], data[plane_type][1])
-            self.plane_types_table.insert("", END, values=element)
-        self.table_scrollbar = ttk.Scrollbar(
+        # имена типов в порядке добавления
+        self.plane_type_names = list(self.plane_types.get_plane_types())
+        self.plane_types_table = VirtualTable(
             self,
-            orient=VERTICAL,
-            command=self.plane_types_table.yview,
+            ("type", "takeoff", "landing"),
+            (
+                "тип самолета",
+                "время взлета (в минутах)",
+                "время посадки (в минутах)",
+            ),
+            lambda: len(self.plane_type_names),
+            self.get_plane_type_row,
         )
-        self.plane_types_table.configure(
-            yscrollcommand=self.table_scrollbar.set,
-        )
-        self.table_scrollbar.grid(row=0, column=3, sticky=NS)
-        self.plane_types_table.grid(row=0, column=0, columnspan=3, sticky=NSEW)
+        self.plane_types_table.grid(row=0, column=0, columnspan=4, sticky=NSEW)
 
         self.plane_type_entry = ttk.Entry(
             self,
@@ -162,25 +401,28 @@ class PlaneTypesWindow(Toplevel):
         # добавляем данные
         element = (plane_type, takeoff_time, landing_time)
         self.plane_types.add_type(*element)
-        self.plane_types_table.insert("", END, values=element)
+        self.plane_type_names.append(plane_type)
+        self.plane_types_table.scroll_to_end()
 
         # очищаем сообщение об ошибке, если нужно
         if self.error_label:
             self.error_label.destroy()
             self.error_label = None
 
+    def get_plane_type_row(self, index):
+        """Возвращает строку таблицы типов самолетов."""
+        plane_type = self.plane_type_names[index]
+        takeoff_time, landing_time = (
+            self.plane_types.get_plane_types()[plane_type]
+        )
+        return plane_type, takeoff_time, landing_time
+
     def apply_default_settings(self):
         """Заполняет базу данных дефолтными данными."""
-        # удаляем старое наполнение базы данных
-        for child in self.plane_types_table.get_children():
-            self.plane_types_table.delete(child)
-
         # заполняем дефолтными значениями
         self.plane_types.use_default_settings()
-        data = self.plane_types.get_plane_types()
-        for plane_type in data:
-            element = (plane_type, data[plane_type][0], data[plane_type][1])
-            self.plane_types_table.insert("", END, values=element)
+        self.plane_type_names = list(self.plane_types.get_plane_types())
+        self.plane_types_table.scroll_to(0)
 
         # очищаем сообщение об ошибке, если нужно
         if self.error_label:
@@ -207,33 +449,23 @@ class ScheduleWindow(Toplevel):
         self.rowconfigure(index=1, weight=1)
         self.rowconfigure(index=2, weight=1)
         self.rowconfigure(index=3, weight=1)
+        self.rowconfigure(index=4, weight=1)
         for i in range(3):
             self.columnconfigure(index=i, weight=1)
 
         # переменные
         self.error_label = None
+        # кол-во выводимых ошибок загрузки расписания из файла
+        self.shown_load_errors_count = 5
         self.flight_schedule = flight_schedule
         self.plane_types = plane_types
         self.start_time = start_time
         self.plane_type_var = StringVar()
         self.flight_type_var = StringVar(value="взлет")
         self.expected_time_var = StringVar(value="00:00")
+        self.search_time_var = StringVar(value="00:00")
 
         # определение элементов окна
-        self.schedule_table = ttk.Treeview(
-            self,
-            columns=("plane_type", "flight_type", "time"),
-            show="headings",
-        )
-        self.schedule_table.heading("plane_type", text="тип самолета")
-        self.schedule_table.heading(
-            "flight_type",
-            text="тип заявки (взлет/посадка)",
-        )
-        self.schedule_table.heading("time", text="ожидаемое время")
-        self.schedule_table.column("#1", stretch=True, anchor=CENTER)
-        self.schedule_table.column("#2", stretch=True, anchor=CENTER)
-        self.schedule_table.column("#3", stretch=True, anchor=CENTER)
         plane_type_names = list(self.plane_types.get_plane_types().keys())
         initial_data = self.flight_schedule.get_schedule()
         # присутствуют лишние типы самолетов -> стираем старое расписание
@@ -241,20 +473,18 @@ class ScheduleWindow(Toplevel):
             if flight[0] not in plane_type_names:
                 self.flight_schedule.clear_schedule()
                 break
-        self.flight_schedule.sort_schedule(self.start_time)
-        data = self.flight_schedule.get_schedule()
-        for flight in data:
-            time_str_value = f'{flight[-1][0]}:{flight[-1][1]}'
-            element = (flight[0], flight[1], time_str_value)
-            self.schedule_table.insert("", END, values=element)
-        self.table_scrollbar = ttk.Scrollbar(
+        self.schedule_table = VirtualTable(
             self,
-            orient=VERTICAL,
-            command=self.schedule_table.yview,
+            ("plane_type", "flight_type", "time"),
+            (
+                "тип самолета",
+                "тип заявки (взлет/посадка)",
+                "ожидаемое время",
+            ),
+            lambda: len(self.flight_schedule.get_schedule()),
+            self.get_schedule_row,
         )
-        self.schedule_table.configure(yscrollcommand=self.table_scrollbar.set)
-        self.table_scrollbar.grid(row=0, column=3, sticky=NS)
-        self.schedule_table.grid(row=0, column=0, columnspan=3, sticky=NSEW)
+        self.schedule_table.grid(row=0, column=0, columnspan=4, sticky=NSEW)
 
         self.plane_type_combobox = ttk.Combobox(
             self,
@@ -298,6 +528,24 @@ class ScheduleWindow(Toplevel):
             command=lambda: self.dismiss(),
         )
         self.exit_button.grid(row=3, column=2, ipadx=10, ipady=10)
+        self.load_button = ttk.Button(
+            self,
+            text="ЗАГРУЗИТЬ ИЗ ФАЙЛА",
+            command=lambda: self.load_flights(),
+        )
+        self.load_button.grid(row=4, column=2, ipadx=10, ipady=10)
+        self.search_time_entry = ttk.Entry(
+            self,
+            textvariable=self.search_time_var,
+            justify=CENTER,
+        )
+        self.search_time_entry.grid(row=4, column=0)
+        self.search_button = ttk.Button(
+            self,
+            text="ПЕРЕЙТИ К ВРЕМЕНИ",
+            command=lambda: self.search_time(),
+        )
+        self.search_button.grid(row=4, column=1, ipadx=10, ipady=10)
 
         # захват ввода
         self.grab_set()
@@ -320,9 +568,13 @@ class ScheduleWindow(Toplevel):
             return
         request_type = self.flight_type_var.get()
         expected_time = self.expected_time_var.get()
-        try:
-            time.strptime(expected_time, '%H:%M')
-        except ValueError:
+
+        # добавляем данные
+        if not self.flight_schedule.add_flight(
+            plane_type,
+            request_type,
+            expected_time,
+        ):
             if self.error_label:
                 self.error_label.destroy()
                 self.error_label = None
@@ -334,20 +586,94 @@ class ScheduleWindow(Toplevel):
             )
             self.error_label.grid(row=2, column=0, columnspan=3)
             return
+        # показываем новый рейс
+        flight_index = self.flight_schedule.get_rotated_flight_index(
+            parse_clock_time(expected_time),
+            self.start_time,
+        )
+        self.schedule_table.scroll_to(flight_index)
 
-        # добавляем данные
-        self.flight_schedule.add_flight(
-            plane_type,
-            request_type,
-            expected_time,
+        # очищаем сообщение об ошибке, если нужно
+        if self.error_label:
+            self.error_label.destroy()
+            self.error_label = None
+
+    def get_schedule_row(self, index):
+        """Возвращает строку таблицы расписания, начиная с момента старта."""
+        flight = self.flight_schedule.get_rotated_flight(
+            index,
+            self.start_time,
+        )
+        parsed_time_str_value = f'{flight[-1][0]}:{flight[-1][1]}'
+        return flight[0], flight[1], parsed_time_str_value
+
+    def search_time(self):
+        """Прокручивает расписание к первому рейсу не раньше времени."""
+        search_time = parse_clock_time(self.search_time_var.get())
+        if search_time is None:
+            if self.error_label:
+                self.error_label.destroy()
+                self.error_label = None
+            self.error_label = ttk.Label(
+                self,
+                foreground="#B71C1C",
+                font=('', 12),
+                text="Некорректный формат времени!",
+            )
+            self.error_label.grid(row=2, column=0, columnspan=3)
+            return
+        self.schedule_table.scroll_to(
+            self.flight_schedule.find_rotated_flight_index(
+                search_time,
+                self.start_time,
+            )
         )
-        self.flight_schedule.sort_schedule(self.start_time)
-        for child in self.schedule_table.get_children():
-            self.schedule_table.delete(child)
-        for flight in self.flight_schedule.get_schedule():
-            parsed_time_str_value = f'{flight[-1][0]}:{flight[-1][1]}'
-            element = (flight[0], flight[1], parsed_time_str_value)
-            self.schedule_table.insert("", END, values=element)
+
+        # очищаем сообщение об ошибке, если нужно
+        if self.error_label:
+            self.error_label.destroy()
+            self.error_label = None
+
+    def load_flights(self):
+        """Загружает рейсы из файла CSV или JSON."""
+        file_path = filedialog.askopenfilename(
+            parent=self,
+            filetypes=[
+                ("расписание", "*.csv *.json"),
+                ("все файлы", "*"),
+            ],
+        )
+        if not file_path:
+            return
+        try:
+            errors = self.flight_schedule.load_flights(
+                file_path,
+                self.plane_types,
+            )
+        except (OSError, UnicodeDecodeError, ValueError):
+            errors = [(0, 'не удалось прочитать файл')]
+        if errors:
+            if self.error_label:
+                self.error_label.destroy()
+                self.error_label = None
+            shown_errors = '; '.join(
+                f'строка {row_number}: {error}'
+                for row_number, error in errors[:self.shown_load_errors_count]
+            )
+            if len(errors) > self.shown_load_errors_count:
+                shown_errors += '; ...'
+            self.error_label = ttk.Label(
+                self,
+                foreground="#B71C1C",
+                font=('', 12),
+                text=f"Ошибок в файле: {len(errors)} ({shown_errors})",
+                wraplength=700,
+            )
+            self.error_label.grid(row=2, column=0, columnspan=3)
+            return
+
+        # выводим новое наполнение базы данных
+        self.schedule_table.scroll_to(0)
 
         # очищаем сообщение об ошибке, если нужно
         if self.error_label:
@@ -371,16 +697,9 @@ class ScheduleWindow(Toplevel):
             )
             self.error_label.grid(row=2, column=0, columnspan=3)
             return
-        self.flight_schedule.sort_schedule(self.start_time)
 
-        # заменяем старое наполнение базы данных
-        for child in self.schedule_table.get_children():
-            self.schedule_table.delete(child)
-        data = self.flight_schedule.get_schedule()
-        for flight in data:
-            parsed_time_str_value = f'{flight[-1][0]}:{flight[-1][1]}'
-            element = (flight[0], flight[1], parsed_time_str_value)
-            self.schedule_table.insert("", END, values=element)
+        # выводим новое наполнение базы данных
+        self.schedule_table.scroll_to(0)
 
         # очищаем сообщение об ошибке, если нужно
         if self.error_label:
@@ -393,36 +712,116 @@ class ScheduleWindow(Toplevel):
         self.destroy()
 
 
+class ProfilingWindow(Toplevel):
+    """Окно замеров длительности этапов моделирования."""
+
+    def __init__(self, dispatcher):
+        super().__init__()
+
+        # конфигурация окна
+        self.title("Профилирование")
+        self.geometry("700x400")
+        self.protocol("WM_DELETE_WINDOW", lambda: self.dismiss())
+        self.rowconfigure(index=0, weight=1)
+        for i in range(4):
+            self.columnconfigure(index=i, weight=1)
+
+        # переменные
+        self.dispatcher = dispatcher
+        self.enabled_var = BooleanVar(value=dispatcher.profiling_enabled)
+        # строки таблицы этапов и период их обновления в мс
+        self.phase_rows = []
+        self.refresh_interval = 500
+        self.refresh_job = None
+
+        # определение элементов окна
+        self.phases_table = VirtualTable(
+            self,
+            ("phase", "count", "mean", "p95", "max"),
+            ("этап", "вызовов", "среднее, мкс", "p95, мкс", "макс., мкс"),
+            lambda: len(self.phase_rows),
+            lambda index: self.phase_rows[index],
+        )
+        self.phases_table.grid(row=0, column=0, columnspan=4, sticky=NSEW)
+        self.enabled_checkbutton = ttk.Checkbutton(
+            self,
+            text="замерять этапы",
+            variable=self.enabled_var,
+            command=lambda: self.dispatcher.set_profiling(
+                self.enabled_var.get(),
+            ),
+        )
+        self.enabled_checkbutton.grid(row=1, column=0, pady=10)
+        self.reset_button = ttk.Button(
+            self,
+            text="СБРОСИТЬ",
+            command=lambda: self.reset(),
+        )
+        self.reset_button.grid(row=1, column=1, ipadx=10, ipady=10)
+        self.dump_button = ttk.Button(
+            self,
+            text="СОХРАНИТЬ JSON",
+            command=lambda: self.dump(),
+        )
+        self.dump_button.grid(row=1, column=2, ipadx=10, ipady=10)
+        self.profile_button = ttk.Button(
+            self,
+            text="CPROFILE ПЕРЕМОТКИ",
+            command=lambda: self.dispatcher.profile_finish_simulation(),
+        )
+        self.profile_button.grid(row=1, column=3, ipadx=10, ipady=10)
+
+        self.refresh()
+
+    def refresh(self):
+        """Обновляет таблицу этапов и планирует следующее обновление."""
+        self.phase_rows = []
+        for phase, stats in self.dispatcher.profiler.get_stats().items():
+            self.phase_rows.append((
+                phase,
+                stats['count'],
+                f'{stats["mean_ns"] / 1000:.1f}',
+                f'{stats["p95_ns"] / 1000:.1f}',
+                f'{stats["max_ns"] / 1000:.1f}',
+            ))
+        self.phases_table.refresh()
+        self.refresh_job = self.after(self.refresh_interval, self.refresh)
+
+    def reset(self):
+        """Сбрасывает накопленные замеры."""
+        self.dispatcher.profiler.reset()
+
+    def dump(self):
+        """Сохраняет замеры в выбранный файл JSON."""
+        file_path = filedialog.asksaveasfilename(
+            parent=self,
+            defaultextension='.json',
+            filetypes=[('JSON', '*.json')],
+        )
+        if file_path:
+            self.dispatcher.profiler.dump(file_path)
+
+    def dismiss(self):
+        """Закрытие окна; замеры продолжаются, если включены."""
+        if self.refresh_job:
+            self.after_cancel(self.refresh_job)
+        self.destroy()
+
+
 class Dispatcher:
     """Система-диспетчер."""
 
-    def __init__(self):
+    def __init__(self, run_mainloop=True):
         # параметры модели
         # ----------------
-        # прошедшее время в минутах
-        self.current_time = None
+        # движок моделирования
+        self.engine = None
         # время начала моделирования
         self.start_time = None
-        # аэропорт
-        self.airport = None
         # расписание полетов
         self.flight_schedule = Schedule()
-        # время полетов с учетом отклонений
-        self.true_flight_time_list = []
-        # кол-во прошедших шагов
-        self.passed_time_ticks = 0
         # время взлета/посадки различных типов самолетов
         self.plane_preparation_time = PlaneTypes()
-        # список всех заявок
-        self.requests = []
-        # кол-во взлетно-посадочных полос
-        self.runway_count = None
-        # интервал между последовательными рейсами на 1 полосе
-        self.safety_time_gap = None
-        # отклонение от расписания (min_variance, max_variance)
-        self.schedule_variance = None
-        # шаг моделирования
-        self.time_tick = None
 
         # интерфейс
         # ------------
@@ -445,22 +844,36 @@ class Dispatcher:
         # вспомогательные окна
         self.plane_types_window = None
         self.schedule_window = None
+        self.profiling_window = None
+
+        # замеры этапов шага; выключенные замеры ничего не стоят
+        self.profiler = PhaseProfiler()
+        self.profiling_enabled = False
 
         # переменные
         self.error_label = None
 
         self.runway_count_var = IntVar(value=2)
+        # допустимое кол-во полос: и для стрелок, и для ввода с клавиатуры
+        self.min_runway_count = 1
+        self.max_runway_count = 1000
         self.min_variance_var = IntVar(value=0)
         self.max_variance_var = IntVar(value=120)
         self.model_step_var = IntVar(value=5)
         self.flight_gap_var = IntVar(value=1)
+        # кол-во моделируемых суток (0 - без ограничения)
+        self.days_var = IntVar(value=1)
         self.start_time_var = StringVar(value="00:00")
 
         self.current_time_var = StringVar(value=self.start_time_var.get())
         self.cur_queue_takeoff_var = IntVar(value=0)
         self.cur_queue_landing_var = IntVar(value=0)
-        self.cur_runway_status_var = [StringVar(value='О')] * 10
-        self.finished_flights_var = []
+        # состояние полосы под курсором в сетке полос
+        self.runway_hover_var = StringVar(value='')
+        # время для поиска в таблице совершенных рейсов
+        self.search_time_var = StringVar(value="00:00")
+        # последние выведенные значения переменных интерфейса
+        self.rendered_values = dict()
 
         self.total_requests_var = IntVar(value=0)
         self.max_delay_var = IntVar(value=0)
@@ -469,7 +882,41 @@ class Dispatcher:
         self.max_queue_landing_var = IntVar(value=0)
         self.avg_queue_takeoff_var = IntVar(value=0)
         self.avg_queue_landing_var = IntVar(value=0)
-        self.avg_runway_occupancy_var = [(i, 'NaN') for i in range(10)]
+        self.window_stats_var = StringVar(value='')
+        # последняя выведенная занятость полос
+        self.runway_occupancy = []
+        self.finish_progress_var = DoubleVar(value=0)
+
+        # перемотка в фоновом потоке
+        # ----------------
+        self.simulation_thread = None
+        self.simulation_cancel_event = Event()
+        # снимки статистики от фонового потока
+        self.snapshot_queue = SimpleQueue()
+        # движок меняется только под блокировкой: фоновый поток держит
+        # ее порциями не дольше snapshot_interval секунд
+        self.engine_lock = RLock()
+        self.snapshot_interval = 0.02
+        # период опроса очереди снимков в мс
+        self.snapshot_poll_interval = 50
+
+        # автоматическое воспроизведение
+        # ----------------
+        # скорость: минут модели в секунду
+        self.play_speed_var = DoubleVar(value=10)
+        # реальное время: минута модели за минуту
+        self.realtime_var = BooleanVar(value=False)
+        self.playing = False
+        self.play_job = None
+        # точка отсчета воспроизведения: (время perf_counter,
+        # время модели, скорость); по ней шаги догоняют реальное время
+        self.play_anchor = None
+        # время на шаги модели за один вызов таймера в секундах
+        self.play_step_budget = 0.02
+        # отрисовка не чаще 30 раз в секунду
+        self.render_interval = 1 / 30
+        self.last_render_time = 0
+        self.render_pending = False
 
         # фрейм ввода параметров
         self.parameters_frame = ttk.Frame(
@@ -492,9 +939,8 @@ class Dispatcher:
         self.runway_count_label.pack(anchor=N, pady=10)
         self.runway_count_spinbox = ttk.Spinbox(
             self.parameters_frame,
-            from_=2.0,
-            to=10.0,
-            state="readonly",
+            from_=self.min_runway_count,
+            to=self.max_runway_count,
             textvariable=self.runway_count_var,
             justify=CENTER,
         )
@@ -579,6 +1025,20 @@ class Dispatcher:
             justify=CENTER,
         )
         self.flight_gap_spinbox.pack(anchor=N)
+        self.days_label = ttk.Label(
+            self.parameters_frame,
+            text="количество суток (0 - без ограничения)",
+        )
+        self.days_label.pack(anchor=N, pady=10)
+        self.days_spinbox = ttk.Spinbox(
+            self.parameters_frame,
+            from_=0.0,
+            to=365.0,
+            state="readonly",
+            textvariable=self.days_var,
+            justify=CENTER,
+        )
+        self.days_spinbox.pack(anchor=N)
         self.start_time_label = ttk.Label(
             self.parameters_frame,
             text="начало работы (формат чч:мм, без пробелов)",
@@ -656,108 +1116,69 @@ class Dispatcher:
         self.model_subframe_1 = ttk.Frame(self.model_frame, borderwidth=0)
         for i in range(3):
             self.model_subframe_1.columnconfigure(index=i, weight=1)
-        self.flight_schedule_table = ttk.Treeview(
+        self.flight_schedule_table = VirtualTable(
             self.model_subframe_1,
-            columns=("time", "runway_id", "request_type"),
-            show="headings",
-        )
-        self.flight_schedule_table.heading("time", text="время")
-        self.flight_schedule_table.heading("runway_id", text="ID полосы")
-        self.flight_schedule_table.heading("request_type", text="тип заявки")
-        self.flight_schedule_table.column("#1", stretch=True, anchor=CENTER)
-        self.flight_schedule_table.column("#2", stretch=True, anchor=CENTER)
-        self.flight_schedule_table.column("#3", stretch=True, anchor=CENTER)
-        self.flight_schedule_table_scrollbar = ttk.Scrollbar(
-            self.model_subframe_1,
-            orient=VERTICAL,
-            command=self.flight_schedule_table.yview,
+            ("time", "runway_id", "request_type"),
+            ("время", "ID полосы", "тип заявки"),
+            self.get_finished_flights_count,
+            self.get_finished_flight_row,
+            lock=self.engine_lock,
         )
-        self.flight_schedule_table.configure(
-            yscrollcommand=self.flight_schedule_table_scrollbar.set,
-        )
-        self.flight_schedule_table_scrollbar.grid(row=0, column=3, sticky=NS)
         self.flight_schedule_table.grid(
             row=0,
             column=0,
             columnspan=3,
             sticky=NSEW,
         )
+        self.search_time_entry = ttk.Entry(
+            self.model_subframe_1,
+            textvariable=self.search_time_var,
+            justify=CENTER,
+        )
+        self.search_time_entry.grid(row=1, column=0, pady=5)
+        self.search_button = ttk.Button(
+            self.model_subframe_1,
+            text="перейти к времени",
+            command=lambda: self.search_finished_flight(),
+        )
+        self.search_button.grid(row=1, column=1, pady=5)
         self.model_subframe_1.pack(anchor=N)
 
         self.cur_runway_occupancy_label = ttk.Label(
             self.model_frame,
-            text="состояние полос (З-занята, С-свободна, О-отключена):",
+            text="состояние полос (красный - занята, зеленый - свободна):",
         )
         self.cur_runway_occupancy_label.pack(anchor=N, pady=10)
+        self.runway_grid = RunwayGrid(self.model_frame, self.runway_hover_var)
+        self.runway_grid.pack(anchor=N)
+        self.runway_hover_label = ttk.Label(
+            self.model_frame,
+            textvariable=self.runway_hover_var,
+        )
+        self.runway_hover_label.pack(anchor=N)
 
         self.model_subframe_2 = ttk.Frame(self.model_frame, borderwidth=0)
-        self.model_subframe_2.columnconfigure(index=0, weight=2)
-        for i in range(1, 11):
-            self.model_subframe_2.columnconfigure(index=i, weight=1)
-        self.runway_id_label = ttk.Label(
-            self.model_subframe_2,
-            text="ID полосы:",
-        )
-        self.runway_id_label.grid(row=0, column=0)
-        self.runway_status_label = ttk.Label(
-            self.model_subframe_2,
-            text="статус:",
-        )
-        self.runway_status_label.grid(row=1, column=0)
-        for i in range(len(self.cur_runway_status_var)):
-            tmp_label_1 = ttk.Label(self.model_subframe_2, text=f"{i}")
-            tmp_label_1.grid(row=0, column=i + 1, ipadx=5, ipady=5)
-        self.runway_label_0 = ttk.Label(
-            self.model_subframe_2,
-            textvariable=self.cur_runway_status_var[0],
-        )
-        self.runway_label_0.grid(row=1, column=1, ipadx=5, ipady=5)
-        self.runway_label_1 = ttk.Label(
-            self.model_subframe_2,
-            textvariable=self.cur_runway_status_var[1],
-        )
-        self.runway_label_1.grid(row=1, column=2, ipadx=5, ipady=5)
-        self.runway_label_2 = ttk.Label(
-            self.model_subframe_2,
-            textvariable=self.cur_runway_status_var[2],
-        )
-        self.runway_label_2.grid(row=1, column=3, ipadx=5, ipady=5)
-        self.runway_label_3 = ttk.Label(
-            self.model_subframe_2,
-            textvariable=self.cur_runway_status_var[3],
-        )
-        self.runway_label_3.grid(row=1, column=4, ipadx=5, ipady=5)
-        self.runway_label_4 = ttk.Label(
-            self.model_subframe_2,
-            textvariable=self.cur_runway_status_var[4],
-        )
-        self.runway_label_4.grid(row=1, column=5, ipadx=5, ipady=5)
-        self.runway_label_5 = ttk.Label(
-            self.model_subframe_2,
-            textvariable=self.cur_runway_status_var[5],
-        )
-        self.runway_label_5.grid(row=1, column=6, ipadx=5, ipady=5)
-        self.runway_label_6 = ttk.Label(
-            self.model_subframe_2,
-            textvariable=self.cur_runway_status_var[6],
-        )
-        self.runway_label_6.grid(row=1, column=7, ipadx=5, ipady=5)
-        self.runway_label_7 = ttk.Label(
+        self.play_speed_label = ttk.Label(
             self.model_subframe_2,
-            textvariable=self.cur_runway_status_var[7],
+            text="скорость (минут модели в секунду)",
         )
-        self.runway_label_7.grid(row=1, column=8, ipadx=5, ipady=5)
-        self.runway_label_8 = ttk.Label(
+        self.play_speed_label.pack(anchor=N, side=LEFT, padx=5)
+        self.play_speed_spinbox = ttk.Spinbox(
             self.model_subframe_2,
-            textvariable=self.cur_runway_status_var[8],
+            values=(0.5, 1, 2, 5, 10, 30, 60, 120, 300, 1440),
+            state="readonly",
+            textvariable=self.play_speed_var,
+            justify=CENTER,
+            width=8,
         )
-        self.runway_label_8.grid(row=1, column=9, ipadx=5, ipady=5)
-        self.runway_label_9 = ttk.Label(
+        self.play_speed_spinbox.pack(anchor=N, side=LEFT, padx=5)
+        self.realtime_checkbutton = ttk.Checkbutton(
             self.model_subframe_2,
-            textvariable=self.cur_runway_status_var[9],
+            text="реальное время",
+            variable=self.realtime_var,
         )
-        self.runway_label_9.grid(row=1, column=10, ipadx=5, ipady=5)
-        self.model_subframe_2.pack(anchor=N)
+        self.realtime_checkbutton.pack(anchor=N, side=LEFT, padx=5)
+        self.model_subframe_2.pack(anchor=N, pady=10)
 
         self.make_step_button = ttk.Button(
             self.model_frame,
@@ -773,6 +1194,20 @@ class Dispatcher:
             ipadx=10,
             ipady=10,
         )
+        self.play_button = ttk.Button(
+            self.model_frame,
+            text="ПУСК",
+            state=["disabled"],
+            command=lambda: self.toggle_play(),
+        )
+        self.play_button.pack(
+            anchor=S,
+            side=LEFT,
+            expand=True,
+            pady=20,
+            ipadx=10,
+            ipady=10,
+        )
         self.finish_model_button = ttk.Button(
             self.model_frame,
             text="ДО КОНЦА",
@@ -787,6 +1222,18 @@ class Dispatcher:
             ipadx=10,
             ipady=10,
         )
+        # индикатор прогресса и отмена показываются только во время перемотки
+        self.finish_progressbar = ttk.Progressbar(
+            self.model_frame,
+            orient=HORIZONTAL,
+            maximum=100,
+            variable=self.finish_progress_var,
+        )
+        self.cancel_finish_button = ttk.Button(
+            self.model_frame,
+            text="ОТМЕНА",
+            command=lambda: self.cancel_simulation(),
+        )
 
         self.model_frame.grid(row=0, column=1, sticky=NSEW)
 
@@ -864,33 +1311,33 @@ class Dispatcher:
             textvariable=self.avg_queue_landing_var,
         )
         self.avg_queue_landing_label.pack(anchor=N)
+        # статистика за скользящее окно выводится в многосуточном режиме
+        self.window_stats_label = ttk.Label(
+            self.statistics_frame,
+            textvariable=self.window_stats_var,
+            justify=CENTER,
+        )
+        self.window_stats_label.pack(anchor=N, pady=5)
         self.avg_runway_occupancy_label = ttk.Label(
             self.statistics_frame,
             text="средняя занятость полос (доля времени):",
         )
         self.avg_runway_occupancy_label.pack(anchor=N)
-        self.avg_runway_occupancy_table = ttk.Treeview(
+        self.avg_runway_occupancy_table = VirtualTable(
             self.statistics_frame,
-            columns=("runway_id", "occupancy"),
-            show="headings",
-        )
-        self.avg_runway_occupancy_table.heading("runway_id", text="ID полосы")
-        self.avg_runway_occupancy_table.heading("occupancy", text="занятость")
-        self.avg_runway_occupancy_table.column(
-            "#1",
-            stretch=True,
-            width=100,
-            anchor=CENTER,
-        )
-        self.avg_runway_occupancy_table.column(
-            "#2",
-            stretch=True,
-            width=100,
-            anchor=CENTER,
+            ("runway_id", "occupancy"),
+            ("ID полосы", "занятость"),
+            lambda: len(self.runway_occupancy),
+            lambda index: (index, self.runway_occupancy[index]),
+            column_width=100,
         )
         self.avg_runway_occupancy_table.pack(anchor=N)
-        for runway in self.avg_runway_occupancy_var:
-            self.avg_runway_occupancy_table.insert("", END, values=runway)
+        self.profiling_button = ttk.Button(
+            self.statistics_frame,
+            text="профилирование",
+            command=lambda: self.create_profiling_window(),
+        )
+        self.profiling_button.pack(anchor=N, pady=10)
         self.exit_button = ttk.Button(
             self.statistics_frame,
             text="ВЫХОД",
@@ -906,7 +1353,9 @@ class Dispatcher:
 
         self.statistics_frame.grid(row=0, column=2, sticky=NSEW)
 
-        self.root.mainloop()
+        # без главного цикла окно управляется вызывающим кодом (замеры)
+        if run_mainloop:
+            self.root.mainloop()
 
     def create_plane_types_window(self):
         """Создание окна-формы с типами самолетов."""
@@ -943,28 +1392,279 @@ class Dispatcher:
             parsed_time,
         )
 
+    def create_profiling_window(self):
+        """Создание окна замеров этапов моделирования."""
+        if self.profiling_window and self.profiling_window.winfo_exists():
+            self.profiling_window.lift()
+            return
+        self.profiling_window = ProfilingWindow(self)
+
+    def set_profiling(self, enabled):
+        """Включает или выключает замеры этапов шага."""
+        self.profiling_enabled = enabled
+        self.profiler.detach()
+        if not enabled:
+            return
+        self.profiler.attach(self, 'get_model_state')
+        if self.engine:
+            self.profiler.attach_engine(self.engine)
+
+    def profile_finish_simulation(self):
+        """Перематывает моделирование до конца под cProfile.
+
+        Перемотка идет в главном потоке: cProfile замеряет только
+        поток, в котором запущен.
+        """
+        if (
+            self.engine is None
+            or self.engine.is_finished()
+            or self.engine.duration is None
+            or self.simulation_thread
+        ):
+            return
+        file_path = filedialog.asksaveasfilename(
+            defaultextension='.prof',
+            filetypes=[('cProfile', '*.prof')],
+        )
+        if not file_path:
+            return
+        time_tick = self.model_step_var.get()
+        profile_call(
+            lambda: self.engine.run_until(self.engine.duration, time_tick),
+            file_path,
+        )
+        self.get_model_state()
+
     def time_step(self):
         """Шаг работы диспетчера."""
-        if self.current_time >= 24 * 60:
+        if not self.engine.step(self.model_step_var.get()):
             return
-        self.time_tick = self.model_step_var.get()
-        self.current_time += self.time_tick
-        self.passed_time_ticks += 1
+        self.get_model_state()
 
-        pending_requests = self.generate_requests()
-        self.airport.add_to_request_queue(pending_requests)
-        self.requests.extend(pending_requests)
-        self.airport.time_tick(self.time_tick)
+    def finish_simulation(self):
+        """Запускает перемотку до конца моделирования в фоновом потоке.
 
+        Окно остается отзывчивым: поток публикует снимки статистики в
+        очередь, а главный поток выводит их, опрашивая очередь.
+        """
+        if self.engine.is_finished() or self.simulation_thread:
+            return
+        self.stop_play()
+        self.simulation_cancel_event.clear()
+        self.finish_progress_var.set(self.engine.get_progress() * 100)
+        self.set_simulation_running(True)
+        self.simulation_thread = Thread(
+            target=self.run_simulation,
+            args=(self.engine, self.model_step_var.get()),
+            daemon=True,
+        )
+        self.simulation_thread.start()
+        self.root.after(self.snapshot_poll_interval, self.poll_snapshots)
+
+    def run_simulation(self, engine, time_tick):
+        """Считает шаги модели до конца или отмены (фоновый поток)."""
+        while (
+            not engine.is_finished()
+            and not self.simulation_cancel_event.is_set()
+        ):
+            with self.engine_lock:
+                deadline = time.perf_counter() + self.snapshot_interval
+                while (
+                    time.perf_counter() < deadline
+                    and not self.simulation_cancel_event.is_set()
+                    and engine.step(time_tick)
+                ):
+                    pass
+                stats = engine.get_stats()
+                released_count, _, changed_flights = (
+                    engine.read_finished_flights()
+                )
+            self.snapshot_queue.put((
+                engine.get_progress(),
+                stats,
+                released_count,
+                bool(changed_flights),
+            ))
+            # даем главному потоку взять блокировку для таблицы рейсов
+            time.sleep(0.001)
+        self.snapshot_queue.put(None)
+
+    def poll_snapshots(self):
+        """Выводит накопившиеся снимки статистики фонового потока."""
+        snapshot = None
+        released_count = 0
+        flights_changed = False
+        finished = False
+        while True:
+            try:
+                next_snapshot = self.snapshot_queue.get_nowait()
+            except Empty:
+                break
+            if next_snapshot is None:
+                finished = True
+                break
+            snapshot = next_snapshot
+            released_count += snapshot[2]
+            flights_changed = flights_changed or snapshot[3]
+        if snapshot:
+            self.finish_progress_var.set(snapshot[0] * 100)
+            self.render_stats(snapshot[1])
+            with self.engine_lock:
+                self.render_finished_flights(
+                    released_count,
+                    None,
+                    flights_changed,
+                )
+        if not finished:
+            self.root.after(self.snapshot_poll_interval, self.poll_snapshots)
+            return
+        self.simulation_thread.join()
+        self.simulation_thread = None
+        self.set_simulation_running(False)
+        # отрисовываем итоговое состояние
         self.get_model_state()
 
-    def finish_simulation(self):
-        """Заканчивает моделирование, вычисляя все шаги сразу."""
-        while self.current_time < 24 * 60:
-            self.time_step()
+    def cancel_simulation(self):
+        """Останавливает перемотку после текущего шага."""
+        self.simulation_cancel_event.set()
+
+    def set_simulation_running(self, running):
+        """Переключает интерфейс на время перемотки в фоновом потоке."""
+        state = 'disabled' if running else 'normal'
+        self.make_step_button['state'] = state
+        self.play_button['state'] = state
+        self.finish_model_button['state'] = state
+        self.begin_refresh_button['state'] = state
+        if running:
+            self.finish_progressbar.pack(
+                anchor=S,
+                side=LEFT,
+                expand=True,
+                pady=20,
+            )
+            self.cancel_finish_button.pack(
+                anchor=S,
+                side=LEFT,
+                expand=True,
+                pady=20,
+            )
+        else:
+            self.finish_progressbar.pack_forget()
+            self.cancel_finish_button.pack_forget()
+
+    def toggle_play(self):
+        """Запускает или приостанавливает воспроизведение."""
+        if self.playing:
+            self.stop_play()
+        else:
+            self.start_play()
+
+    def start_play(self):
+        """Запускает автоматическое воспроизведение моделирования."""
+        if (
+            self.engine is None
+            or self.engine.is_finished()
+            or self.simulation_thread
+        ):
+            return
+        self.playing = True
+        self.play_anchor = None
+        self.play_button['text'] = 'ПАУЗА'
+        self.make_step_button['state'] = 'disabled'
+        self.play_job = self.root.after(0, self.play_tick)
+
+    def stop_play(self):
+        """Приостанавливает воспроизведение."""
+        if not self.playing:
+            return
+        self.playing = False
+        if self.play_job:
+            self.root.after_cancel(self.play_job)
+            self.play_job = None
+        self.play_button['text'] = 'ПУСК'
+        self.make_step_button['state'] = 'normal'
+        if self.render_pending:
+            self.render_play_frame()
+
+    def get_play_speed(self):
+        """Возвращает скорость воспроизведения в минутах модели в секунду."""
+        if self.realtime_var.get():
+            return 1 / 60
+        try:
+            return max(self.play_speed_var.get(), 1 / 60)
+        except TclError:
+            return 1 / 60
+
+    def play_tick(self):
+        """Шаг таймера воспроизведения.
+
+        Считает шаги модели, время которых уже наступило по точке
+        отсчета, поэтому задержки таймера не накапливаются. Если шаги
+        не успевают за скоростью, отставание в режиме реального времени
+        догоняется, а в остальных режимах сбрасывается. Отрисовка
+        выполняется не чаще render_interval.
+        """
+        self.play_job = None
+        time_tick = self.model_step_var.get()
+        speed = self.get_play_speed()
+        realtime = self.realtime_var.get()
+        now = time.perf_counter()
+        # смена скорости начинает новый отсчет
+        if self.play_anchor is None or self.play_anchor[2] != speed:
+            self.play_anchor = (now, self.engine.current_time, speed)
+        anchor_time, anchor_model_time, _ = self.play_anchor
+        target_time = anchor_model_time + (now - anchor_time) * speed
+
+        deadline = now + self.play_step_budget
+        while (
+            self.engine.current_time + time_tick <= target_time
+            and time.perf_counter() < deadline
+            and self.engine.step(time_tick)
+        ):
+            self.render_pending = True
+        if (
+            not realtime
+            and self.engine.current_time + time_tick <= target_time
+        ):
+            self.play_anchor = (
+                time.perf_counter(),
+                self.engine.current_time,
+                speed,
+            )
+            anchor_time, anchor_model_time, _ = self.play_anchor
+
+        now = time.perf_counter()
+        if (
+            self.render_pending
+            and now - self.last_render_time >= self.render_interval
+        ):
+            self.render_play_frame()
+        if self.engine.is_finished():
+            self.stop_play()
+            return
+
+        # следующий вызов - к сроку следующего шага модели, но не реже
+        # кадра, чтобы отложенная отрисовка не задерживалась
+        next_step_time = (
+            anchor_time
+            + (self.engine.current_time + time_tick - anchor_model_time)
+            / speed
+        )
+        delay = min(next_step_time - now, self.render_interval)
+        self.play_job = self.root.after(
+            max(1, int(delay * 1000)),
+            self.play_tick,
+        )
+
+    def render_play_frame(self):
+        """Отрисовывает состояние модели при воспроизведении."""
+        self.get_model_state()
+        self.last_render_time = time.perf_counter()
+        self.render_pending = False
 
     def dismiss(self):
         """Закрытие окна."""
+        self.simulation_cancel_event.set()
         self.root.destroy()
 
     def start_modeling(self):
@@ -986,6 +1686,26 @@ class Dispatcher:
                 )
                 self.error_label.pack(anchor=N, pady=20)
                 return
+            try:
+                runway_count = self.runway_count_var.get()
+            except TclError:
+                runway_count = 0
+            if not (
+                self.min_runway_count
+                <= runway_count
+                <= self.max_runway_count
+            ):
+                if self.error_label:
+                    self.error_label.destroy()
+                    self.error_label = None
+                self.error_label = ttk.Label(
+                    self.parameters_frame,
+                    foreground="#B71C1C",
+                    font=('', 12),
+                    text="Некорректное количество полос!",
+                )
+                self.error_label.pack(anchor=N, pady=20)
+                return
             if self.min_variance_var.get() > self.max_variance_var.get():
                 if self.error_label:
                     self.error_label.destroy()
@@ -1001,30 +1721,43 @@ class Dispatcher:
 
             # установка значений параметров
             self.start_time = (start_time.tm_hour, start_time.tm_min)
-            self.current_time = 0
-            self.time_tick = self.model_step_var.get()
-            self.schedule_variance = (
+            schedule_variance = (
                 self.min_variance_var.get(),
                 self.max_variance_var.get(),
             )
-            self.runway_count = self.runway_count_var.get()
-            self.safety_time_gap = self.flight_gap_var.get()
-            self.airport = Airport(
+            days = self.days_var.get() or None
+            # создание движка и списка полетов с учетом отклонений
+            self.engine = SimulationEngine(
                 self.plane_preparation_time,
-                self.runway_count,
-                self.safety_time_gap
+                self.flight_schedule,
+                runway_count,
+                self.flight_gap_var.get(),
+                schedule_variance,
+                self.model_step_var.get(),
+                self.start_time,
+                days=days,
             )
+            self.runway_grid.set_runway_count(runway_count)
+            # замеры переносятся на новый движок
+            if self.profiling_enabled:
+                self.set_profiling(True)
 
             # блокировка ввода и изменение интерфейса
             self.add_plane_button['state'] = 'disabled'
             self.add_schedule_button['state'] = 'disabled'
             self.make_step_button['state'] = 'normal'
-            self.finish_model_button['state'] = 'normal'
+            self.play_button['state'] = 'normal'
+            # без ограничения по времени моделирование не заканчивается
+            if days is None:
+                self.finish_model_button['state'] = 'disabled'
+            else:
+                self.finish_model_button['state'] = 'normal'
             self.begin_refresh_button['text'] = 'ЗАНОВО'
             self.runway_count_spinbox['state'] = 'disabled'
             self.min_variance_spinbox['state'] = 'disabled'
             self.max_variance_spinbox['state'] = 'disabled'
             self.flight_gap_spinbox['state'] = 'disabled'
+            self.days_spinbox['state'] = 'disabled'
             self.start_time_entry['state'] = 'disabled'
 
             # очищаем сообщение об ошибке, если нужно
@@ -1032,9 +1765,6 @@ class Dispatcher:
                 self.error_label.destroy()
                 self.error_label = None
 
-            # создание списка полетов с учетом отклонений
-            self.create_true_schedule()
-
             # запуск моделирования
             self.time_step()
         # перезапускаем моделирование процесса
@@ -1042,129 +1772,99 @@ class Dispatcher:
             ...
 
     def get_model_state(self):
-        """Собирает информацию для вывода статистики работы модели."""
-        current_time = (
-            self.start_time[0] * 60 + self.start_time[1] + self.current_time
-        )
-        if current_time >= 24 * 60:
-            current_time -= 24 * 60
-        current_time = (current_time // 60, current_time % 60)
-        self.current_time_var.set(f'{current_time[0]}:{current_time[1]}')
-
-        cur_landing_queue, cur_takeoff_queue = (
-            self.airport.get_current_queue_length()
-        )
-        self.cur_queue_takeoff_var.set(cur_takeoff_queue)
-        self.cur_queue_landing_var.set(cur_landing_queue)
-
-        max_landing_queue, max_takeoff_queue = self.airport.get_queue_stats()
-        self.max_queue_landing_var.set(max_landing_queue)
-        self.max_queue_takeoff_var.set(max_takeoff_queue)
-
-        avg_landing_queue, avg_takeoff_queue = (
-            self.airport.get_avg_queue_length(self.passed_time_ticks)
-        )
-        self.avg_queue_landing_var.set(avg_landing_queue)
-        self.avg_queue_takeoff_var.set(avg_takeoff_queue)
-
-        cur_runway_statuses = self.airport.get_runway_statuses()
-        for i in range(len(cur_runway_statuses)):
-            runway_status = cur_runway_statuses[i]
-            if runway_status == 'free':
-                self.cur_runway_status_var[i].set('С')
-            elif runway_status == 'busy':
-                self.cur_runway_status_var[i].set('З')
-
-        completed_requests = 0
-        takeoff_request_count = 0
-        max_delay = 0
-        total_delay = 0
-        for request in self.requests:
-            if request.get_status() == 'ok':
-                completed_requests += 1
-            if request.get_request_type() == 'взлет':
-                takeoff_request_count += 1
-                delay = request.get_time_delay()
-                total_delay += delay
-                if delay > max_delay:
-                    max_delay = delay
-        if takeoff_request_count == 0:
-            avg_delay = 0
+        """Выводит статистику работы модели."""
+        self.render_stats(self.engine.get_stats())
+        self.render_finished_flights(*self.engine.read_finished_flights())
+
+    def render_stats(self, stats):
+        """Выводит снимок статистики модели."""
+        current_time = stats['current_time']
+        if self.engine.days == 1:
+            current_time_text = f'{current_time[0]}:{current_time[1]}'
         else:
-            avg_delay = total_delay / takeoff_request_count
-        self.total_requests_var.set(completed_requests)
-        self.max_delay_var.set(max_delay)
-        self.avg_delay_var.set(avg_delay)
-
-        runway_stats = self.airport.get_runway_occupancy_stats(
-            self.current_time,
-        )
-        for i in range(len(runway_stats)):
-            self.avg_runway_occupancy_var[i] = (i, runway_stats[i])
-        for child in self.avg_runway_occupancy_table.get_children():
-            self.avg_runway_occupancy_table.delete(child)
-        for runway in self.avg_runway_occupancy_var:
-            self.avg_runway_occupancy_table.insert("", END, values=runway)
-
-        for child in self.flight_schedule_table.get_children():
-            self.flight_schedule_table.delete(child)
-        self.finished_flights_var = self.airport.get_finished_requests_info(
-            self.start_time,
-        )
-        for flight in self.finished_flights_var:
-            flight_val = (
-                f'{flight[0][0]}:{flight[0][1]}',
-                flight[1],
-                flight[2],
-            )
-            self.flight_schedule_table.insert("", END, values=flight_val)
-
-    def create_true_schedule(self):
-        """Создает расписание с учетом отклонений."""
-        distribution_radius = (
-            (self.schedule_variance[1] - self.schedule_variance[0]) / 2
-        )
-        distribution_center = self.schedule_variance[1] - distribution_radius
-        start_time = self.start_time[0] * 60 + self.start_time[1]
-
-        schedule = self.flight_schedule.get_schedule()
-        for flight in schedule:
-            flight_time = flight[-1][0] * 60 + flight[-1][1] - start_time
-            if flight_time < 0:
-                flight_time += 24 * 60
-
-            random_variance = round(
-                gauss(
-                    mu=0.0,
-                    sigma=1.0,
-                ) * distribution_radius / 3 + distribution_center
+            current_time_text = (
+                f'сутки {stats["day"] + 1}, '
+                f'{current_time[0]}:{current_time[1]}'
             )
-            if random_variance > self.schedule_variance[1]:
-                random_variance = self.schedule_variance[1]
-            if random_variance < self.schedule_variance[0]:
-                random_variance = self.schedule_variance[0]
-            is_negative = randint(0, 1)
-            if is_negative:
-                random_variance *= (-1)
-            if flight[1] == 'взлет':
-                random_variance = abs(random_variance)
-
-            flight_time += random_variance
-            true_flight = (flight[0], flight[1], random_variance, flight_time)
-            self.true_flight_time_list.append(true_flight)
-
-        self.true_flight_time_list.sort(key=lambda flight: flight[-1])
-
-    def generate_requests(self):
-        """Генерация заявок."""
-        pending_requests = []
-        for i in range(len(self.true_flight_time_list)):
-            flight = self.true_flight_time_list[i]
-            waiting_time = self.current_time - flight[-1]
-            if waiting_time < 0:
-                self.true_flight_time_list = self.true_flight_time_list[i:]
-                break
-            new_request = Request(flight[0], flight[1], flight[2], flight[-1])
-            new_request.update_waiting_time(waiting_time)
-            pending_requests.append(new_request)
-        return pending_requests
+        self.update_var(self.current_time_var, current_time_text)
+
+        self.update_var(self.cur_queue_takeoff_var, stats['cur_takeoff_queue'])
+        self.update_var(self.cur_queue_landing_var, stats['cur_landing_queue'])
+
+        self.update_var(self.max_queue_landing_var, stats['max_landing_queue'])
+        self.update_var(self.max_queue_takeoff_var, stats['max_takeoff_queue'])
+
+        self.update_var(self.avg_queue_landing_var, stats['avg_landing_queue'])
+        self.update_var(self.avg_queue_takeoff_var, stats['avg_takeoff_queue'])
+
+        self.runway_grid.render_statuses(stats['runway_statuses'])
+
+        self.update_var(self.total_requests_var, stats['completed_requests'])
+        self.update_var(self.max_delay_var, stats['max_delay'])
+        self.update_var(self.avg_delay_var, stats['avg_delay'])
+
+        self.render_runway_occupancy(stats['runway_occupancy'])
+        self.render_window_stats(stats.get('window'))
+
+    def render_window_stats(self, window_stats):
+        """Выводит статистику за скользящее окно последних суток."""
+        if not window_stats or self.engine.days == 1:
+            self.update_var(self.window_stats_var, '')
+            return
+        window_hours = window_stats['window_length'] // 60
+        self.update_var(
+            self.window_stats_var,
+            f'за последние {window_hours} ч:\n'
+            f'обслужено заявок: {window_stats["completed_requests"]}\n'
+            f'максимальная задержка: {window_stats["max_delay"]} мин.\n'
+            f'средняя задержка: {window_stats["avg_delay"]:.1f} мин.\n'
+            f'средняя очередь: взлет '
+            f'{window_stats["avg_takeoff_queue"]:.2f}, посадка '
+            f'{window_stats["avg_landing_queue"]:.2f}',
+        )
+
+    def update_var(self, variable, value):
+        """Обновляет переменную интерфейса, только если значение изменилось."""
+        variable_name = str(variable)
+        if self.rendered_values.get(variable_name) == value:
+            return
+        self.rendered_values[variable_name] = value
+        variable.set(value)
+
+    def render_runway_occupancy(self, runway_stats):
+        """Обновляет видимые строки таблицы занятости полос."""
+        self.runway_occupancy = runway_stats
+        self.avg_runway_occupancy_table.refresh()
+
+    def render_finished_flights(
+        self, released_count, changed_index, changed_flights
+    ):
+        """Обновляет видимые строки таблицы совершенных рейсов."""
+        if not released_count and not changed_flights:
+            return
+        # рейсы, удаленные из начала списка, сдвигают видимые строки
+        self.flight_schedule_table.first_row_index -= released_count
+        self.flight_schedule_table.refresh()
+
+    def get_finished_flights_count(self):
+        """Возвращает кол-во строк таблицы совершенных рейсов.
+
+        Таблица читает кол-во и строки под engine_lock одним блоком.
+        """
+        if self.engine is None:
+            return 0
+        return self.engine.get_finished_flights_count()
+
+    def get_finished_flight_row(self, index):
+        """Возвращает строку таблицы совершенных рейсов."""
+        flight = self.engine.get_finished_flight(index)
+        return f'{flight[0][0]}:{flight[0][1]}', flight[1], flight[2]
+
+    def search_finished_flight(self):
+        """Прокручивает таблицу к первому рейсу не раньше времени."""
+        search_time = parse_clock_time(self.search_time_var.get())
+        if search_time is None or self.engine is None:
+            return
+        with self.engine_lock:
+            flight_index = self.engine.find_finished_flight(search_time)
+        self.flight_schedule_table.scroll_to(flight_index)
@@ -1,10 +1,67 @@
-import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+import csv
+from heapq import heappop, heappush, merge
+import json
+from math import ceil
+from random import Random
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# коды типов заявок
+LANDING = 0
+TAKEOFF = 1
+REQUEST_TYPE_NAMES = ('посадка', 'взлет')
+REQUEST_TYPE_CODES = {'посадка': LANDING, 'взлет': TAKEOFF}
+
+# коды статусов заявок
+WAITING = 0
+COMPLETED = 1
+STATUS_NAMES = ('wait', 'ok')
+
+# кол-во последних совершенных рейсов,
+# хранимых при моделировании нескольких суток
+FLIGHT_HISTORY_LIMIT = 5000
+
+# поля рейса в файле расписания: ключи объектов JSON и заголовок CSV
+SCHEDULE_FIELDS = ('plane_type', 'request_type', 'time')
+
+
+def parse_clock_time(value):
+    """Разбирает время в формате чч:мм, возвращает (часы, минуты) или None."""
+    hours, separator, minutes = value.partition(':')
+    if (
+        not separator
+        or not 0 < len(hours) <= 2
+        or not 0 < len(minutes) <= 2
+        or not hours.isascii()
+        or not hours.isdigit()
+        or not minutes.isascii()
+        or not minutes.isdigit()
+    ):
+        return None
+    hours = int(hours)
+    minutes = int(minutes)
+    if hours > 23 or minutes > 59:
+        return None
+    return hours, minutes
 
 
 class Airport:
     """Аэропорт."""
 
-    def __init__(self, plane_preparation_time, runway_count, safety_time_gap):
+    def __init__(
+        self,
+        plane_preparation_time,
+        runway_count,
+        safety_time_gap,
+        flight_history_limit=None,
+    ):
         # входные параметры
         # получены от агрегирующего класса (диспетчера)
         self.plane_preparation_time = plane_preparation_time
@@ -14,40 +71,107 @@ class Airport:
         self.runways = []
         for i in range(runway_count):
             self.runways.append(Runway())
-        # очередь заявок
-        self.requests = []
-        # кол-во новоприбывших заявок на одном шаге
-        self.new_requests_count = 0
+        # совершенные рейсы в порядке времени окончания
+        self.finished_flights = FinishedFlights(flight_history_limit)
+        # все поступившие заявки
+        self.request_store = RequestStore(self.plane_preparation_time)
+        # очереди заявок на посадку и взлет: номера заявок в хранилище
+        self.landing_requests = deque()
+        self.takeoff_requests = deque()
+        # кол-во заявок в хранилище, при котором проверяется
+        # возможность освободить закрытые заявки
+        self.request_release_size = 1024
+        # прошедшее время в минутах
+        self.current_time = 0
+        # номера свободных полос
+        self.free_runways = list(range(runway_count))
+        # смены состояния занятых полос: (момент времени, номер полосы)
+        self.runway_events = []
+        # момент, до которого просчитана каждая полоса
+        self.runway_sync_times = [0] * runway_count
 
         # статистика работы аэропорта
-        self.max_landing_queue = 0
-        self.max_takeoff_queue = 0
-        self.total_landing_queue = 0
-        self.total_takeoff_queue = 0
+        self.statistics = Statistics()
 
     def time_tick(self, time_tick):
         """Шаг работы аэропорта."""
-        # обновляем время ожидания старых заявок в очереди
-        for i in range(len(self.requests) - self.new_requests_count):
-            self.requests[i].update_waiting_time(time_tick)
+        self.set_current_time(self.current_time + time_tick)
+        self.process_time_tick()
+
+    def process_time_tick(self):
+        """Обрабатывает наступивший момент времени.
+
+        Просчитываются только полосы, состояние которых меняется, и
+        только свободные полосы получают заявки.
+        """
         # шаг работы полос
-        for runway in self.runways:
-            runway.time_tick(time_tick, self.safety_time_gap)
+        self.process_runway_events()
         # распределяем заявки по полосам
-        for runway in self.runways:
-            if not self.requests:
-                break
-            current_request = self.requests[0]
-            completion_time = self.get_request_completion_time(current_request)
-            if runway.process_request(
-                current_request,
-                completion_time,
-                self.safety_time_gap,
-            ):
-                self.requests.pop(0)
+        self.dispatch_requests()
         # обновляем статистику по очередям
-        self.update_max_queue_length()
-        self.update_total_queue_length()
+        self.update_queue_stats()
+
+    def set_current_time(self, current_time):
+        """Устанавливает текущее время аэропорта."""
+        self.current_time = current_time
+        self.statistics.set_current_time(current_time)
+
+    def get_next_runway_event_time(self):
+        """Возвращает момент ближайшей смены состояния полосы или None."""
+        if self.runway_events:
+            return self.runway_events[0][0]
+        return None
+
+    def process_runway_events(self):
+        """Просчитывает полосы, состояние которых уже должно смениться."""
+        while (
+            self.runway_events
+            and self.runway_events[0][0] <= self.current_time
+        ):
+            runway_index = heappop(self.runway_events)[1]
+            self.runway_time_tick(
+                runway_index,
+                self.current_time - self.runway_sync_times[runway_index],
+            )
+            self.runway_sync_times[runway_index] = self.current_time
+            self.schedule_runway_event(runway_index)
+
+    def schedule_runway_event(self, runway_index):
+        """Планирует следующую смену состояния полосы."""
+        time_to_event = self.runways[runway_index].get_time_to_event()
+        if time_to_event is None:
+            heappush(self.free_runways, runway_index)
+        else:
+            heappush(
+                self.runway_events,
+                (self.current_time + time_to_event, runway_index),
+            )
+
+    def sync_runways(self):
+        """Просчитывает занятые полосы до текущего момента времени."""
+        for i in range(len(self.runways)):
+            passed_time = self.current_time - self.runway_sync_times[i]
+            if passed_time > 0:
+                self.runways[i].skip_time(passed_time)
+                self.runway_sync_times[i] = self.current_time
+
+    def runway_time_tick(self, runway_index, time_tick):
+        """Шаг работы полосы с учетом закрытых заявок."""
+        finished_request = self.runways[runway_index].time_tick(
+            time_tick,
+            self.safety_time_gap,
+        )
+        if finished_request:
+            self.complete_request(runway_index, finished_request)
+
+    def complete_request(self, runway_index, request):
+        """Учитывает заявку, закрытую полосой."""
+        self.statistics.complete_request(request)
+        self.finished_flights.add_flight(
+            request.get_process_time() + request.get_service_time(),
+            runway_index,
+            request.get_request_kind(),
+        )
 
     def get_runway_statuses(self):
         """Возвращает состояние всех полос."""
@@ -58,6 +182,7 @@ class Airport:
 
     def get_runway_occupancy_stats(self, passed_time):
         """Вычисляет статистику занятости полос."""
+        self.sync_runways()
         avg_occupancies = []
         for runway in self.runways:
             avg_occupancies.append(runway.get_avg_occupancy(passed_time))
@@ -65,98 +190,203 @@ class Airport:
 
     def get_queue_stats(self):
         """Возвращает статистику по полосам."""
-        return self.max_landing_queue, self.max_takeoff_queue
+        return self.statistics.get_max_queue_length()
 
     def get_current_queue_length(self):
-        """Вычисляет длины текущих очередей на В/П."""
-        current_landing_queue, current_takeoff_queue = 0, 0
-        for request in self.requests:
-            if request.get_request_type() == 'landing':
-                current_landing_queue += 1
-            else:
-                current_takeoff_queue += 1
-        return current_landing_queue, current_takeoff_queue
+        """Возвращает длины текущих очередей на В/П."""
+        return len(self.landing_requests), len(self.takeoff_requests)
 
-    def update_max_queue_length(self):
-        """Обновляет максимальные длины очередей на В/П."""
-        current_landing_queue, current_takeoff_queue = (
-            self.get_current_queue_length()
-        )
-        if current_landing_queue > self.max_landing_queue:
-            self.max_landing_queue = current_landing_queue
-        if current_takeoff_queue > self.max_takeoff_queue:
-            self.max_takeoff_queue = current_takeoff_queue
+    def update_queue_stats(self, time_ticks_count=1, time_tick=0):
+        """Обновляет статистику по очередям на В/П.
 
-    def update_total_queue_length(self):
-        """Обновляет суммарные длины очередей на В/П."""
+        Учитывает time_ticks_count шагов длиной time_tick, последний из
+        которых заканчивается в текущий момент времени.
+        """
         current_landing_queue, current_takeoff_queue = (
             self.get_current_queue_length()
         )
-        self.total_landing_queue += current_landing_queue
-        self.total_takeoff_queue += current_takeoff_queue
+        self.statistics.update_queue_length(
+            current_landing_queue,
+            current_takeoff_queue,
+            time_ticks_count,
+            time_tick,
+        )
 
     def get_avg_queue_length(self, passed_time_ticks):
         """Вычисляет средние длины очередей на В/П."""
-        avg_landing_queue = self.total_landing_queue / passed_time_ticks
-        avg_takeoff_queue = self.total_takeoff_queue / passed_time_ticks
-        return avg_landing_queue, avg_takeoff_queue
+        return self.statistics.get_avg_queue_length(passed_time_ticks)
 
     def get_request_completion_time(self, request):
-        """Вычисляет время обслуживания заявки."""
-        plane_type = request.get_plane_type()
-        request_type = request.get_request_type()
-        if request_type == 'takeoff':
-            request_completion_time = (
-                self.plane_preparation_time.get_plane_types()[plane_type][0]
-            )
-        else:
-            request_completion_time = (
-                self.plane_preparation_time.get_plane_types()[plane_type][1]
-            )
-        return request_completion_time
+        """Возвращает время обслуживания заявки."""
+        return request.get_service_time()
 
     def add_to_request_queue(self, requests):
         """Добавляет новые заявки в очередь."""
-        self.requests.extend(requests)
-        self.new_requests_count = len(requests)
+        for request in requests:
+            self.statistics.add_request(request)
+            if request.get_request_kind() == LANDING:
+                self.landing_requests.append(request.get_index())
+            else:
+                self.takeoff_requests.append(request.get_index())
+        if len(self.request_store) >= self.request_release_size:
+            self.release_completed_requests()
 
-    def get_finished_requests_info(self, start_time):
-        """Получает информацию о совершенных рейсах."""
-        finished_requests = []
-        true_start_time = start_time[0] * 60 + start_time[1]
-        plane_types = self.plane_preparation_time.get_plane_types()
+    def release_completed_requests(self):
+        """Освобождает хранилище от заявок, которые больше не нужны.
 
-        for i in range(len(self.runways)):
-            runway_requests = self.runways[i].get_flight_history()
-            for request in runway_requests:
-                request_plane = request.get_plane_type()
-                request_type = request.get_request_type()
-                if request_type == 'взлет':
-                    time_added = plane_types[request_plane][0]
-                else:
-                    time_added = plane_types[request_plane][1]
-                request_time = request.get_process_time() + time_added
-                request_time += true_start_time
-                if request_time >= 24 * 60:
-                    request_time -= 24 * 60
-                elif request_time < 0:
-                    request_time = 24 * 60 - request_time
-                request_time = (request_time // 60, request_time % 60)
-                finished_requests.append((request_time, i, request_type))
-
-        finished_requests.sort(key=lambda flight: flight[0])
-        if len(finished_requests):
-            partition_index = 0
-            for i in range(len(finished_requests)):
-                if finished_requests[i][0] >= start_time:
-                    partition_index = i
-                    break
-            partition_part = finished_requests[:partition_index]
-            true_sorted_schedule = finished_requests[partition_index:]
-            finished_requests = true_sorted_schedule
-            finished_requests.extend(partition_part)
+        Заявки назначаются на полосы в порядке поступления, поэтому все
+        заявки раньше первой заявки в очереди и раньше обслуживаемых
+        полосами уже закрыты и учтены в статистике.
+        """
+        first_needed_index = self.request_store.get_requests_count()
+        if self.landing_requests:
+            first_needed_index = min(
+                first_needed_index,
+                self.landing_requests[0],
+            )
+        if self.takeoff_requests:
+            first_needed_index = min(
+                first_needed_index,
+                self.takeoff_requests[0],
+            )
+        for current_request in self.get_current_requests():
+            first_needed_index = min(
+                first_needed_index,
+                current_request.get_index(),
+            )
+        self.request_store.release_requests(first_needed_index)
+        self.request_release_size = max(1024, 2 * len(self.request_store))
 
-        return finished_requests
+    def dispatch_requests(self):
+        """Распределяет заявки по свободным полосам в порядке их номеров."""
+        while self.has_requests() and self.free_runways:
+            runway_index = heappop(self.free_runways)
+            self.dispatch_request(self.runways[runway_index])
+            self.runway_sync_times[runway_index] = self.current_time
+            self.schedule_runway_event(runway_index)
+
+    def get_current_requests(self):
+        """Возвращает заявки, обслуживаемые полосами."""
+        return [
+            runway.current_request
+            for runway in self.runways
+            if runway.current_request
+        ]
+
+    def has_requests(self):
+        """Проверяет наличие заявок в очереди."""
+        return bool(self.landing_requests or self.takeoff_requests)
+
+    def get_first_queue(self):
+        """Возвращает очередь, в начале которой стоит самая ранняя заявка."""
+        if not self.takeoff_requests:
+            return self.landing_requests
+        if not self.landing_requests:
+            return self.takeoff_requests
+        if self.landing_requests[0] < self.takeoff_requests[0]:
+            return self.landing_requests
+        return self.takeoff_requests
+
+    def dispatch_request(self, runway):
+        """Передает самую раннюю заявку полосе, если та свободна."""
+        first_queue = self.get_first_queue()
+        current_request = self.request_store.get_request(first_queue[0])
+        completion_time = self.get_request_completion_time(current_request)
+        if runway.process_request(
+            current_request,
+            completion_time,
+            self.safety_time_gap,
+        ):
+            first_queue.popleft()
+            self.start_request(current_request)
+            return True
+        return False
+
+    def start_request(self, request):
+        """Учитывает назначение заявки на полосу."""
+        request.update_waiting_time(
+            self.current_time - request.get_process_time()
+        )
+        self.statistics.dispatch_request(request)
+
+    def read_finished_requests_info(self, start_time):
+        """Получает изменения списка совершенных рейсов с прошлого чтения."""
+        return self.finished_flights.read_flights_info(start_time)
+
+
+class RunwayBankAirport(Airport):
+    """Аэропорт, состояние полос которого хранится в RunwayBank.
+
+    Все полосы просчитываются за шаг несколькими векторными операциями
+    numpy; результаты совпадают с результатами Airport.
+    """
+
+    def __init__(
+        self,
+        plane_preparation_time,
+        runway_count,
+        safety_time_gap,
+        flight_history_limit=None,
+    ):
+        super().__init__(
+            plane_preparation_time,
+            0,
+            safety_time_gap,
+            flight_history_limit,
+        )
+        self.runways = RunwayBank(runway_count)
+        # момент, до которого просчитаны полосы
+        self.runway_sync_time = 0
+
+    def process_runway_events(self):
+        """Просчитывает все полосы до текущего момента времени."""
+        finished_requests = self.runways.time_tick(
+            self.current_time - self.runway_sync_time,
+        )
+        self.runway_sync_time = self.current_time
+        for runway_index, finished_request in finished_requests:
+            self.complete_request(runway_index, finished_request)
+
+    def dispatch_requests(self):
+        """Распределяет заявки по свободным полосам в порядке их номеров."""
+        if not self.has_requests():
+            return
+        for runway_index in self.runways.get_free_runways():
+            if not self.has_requests():
+                break
+            self.dispatch_request(runway_index)
+
+    def get_next_runway_event_time(self):
+        """Возвращает момент ближайшей смены состояния полосы или None."""
+        time_to_event = self.runways.get_time_to_event()
+        if time_to_event is None:
+            return None
+        return self.runway_sync_time + time_to_event
+
+    def dispatch_request(self, runway_index):
+        """Передает самую раннюю заявку свободной полосе."""
+        first_queue = self.get_first_queue()
+        current_request = self.request_store.get_request(first_queue.popleft())
+        self.runways.process_request(
+            runway_index,
+            current_request,
+            self.get_request_completion_time(current_request),
+            self.safety_time_gap,
+        )
+        self.start_request(current_request)
+        return True
+
+    def get_runway_statuses(self):
+        """Возвращает состояние всех полос."""
+        return self.runways.get_statuses()
+
+    def get_runway_occupancy_stats(self, passed_time):
+        """Вычисляет статистику занятости полос."""
+        return self.runways.get_avg_occupancies(passed_time)
+
+    def get_current_requests(self):
+        """Возвращает заявки, обслуживаемые полосами."""
+        return self.runways.get_current_requests()
 
 
 class Runway:
@@ -173,19 +403,19 @@ class Runway:
         self.safety_time_gap = 0
 
         # статистика работы полосы
-        self.flight_history = []
         self.occupancy_time = 0
 
     def time_tick(self, time_tick, safety_time_gap):
-        """Шаг работы полосы."""
+        """Шаг работы полосы, возвращает закрытую заявку."""
+        finished_request = None
         if self.status == 'busy':
             remaining_time = time_tick - self.request_completion_time
             if remaining_time >= 0:
                 # закрываем заявку
                 if self.current_request:
                     self.occupancy_time += self.request_completion_time
-                    self.current_request.update_status('ok')
-                    self.update_flight_history(self.current_request)
+                    self.current_request.complete()
+                    finished_request = self.current_request
                     self.current_request = None
                     self.request_completion_time = 0
                 # освобождаем полосу
@@ -197,6 +427,7 @@ class Runway:
             else:
                 self.request_completion_time -= time_tick
                 self.occupancy_time += time_tick
+        return finished_request
 
     def process_request(self, request, completion_time, safety_time_gap):
         """Определяет возможность обслуживания заявки."""
@@ -217,68 +448,395 @@ class Runway:
         avg_occupancy = self.occupancy_time / passed_time
         return avg_occupancy
 
-    def update_flight_history(self, request):
-        """Пополняет список обслуженных полосой заявок."""
-        self.flight_history.append(request)
+    def get_time_to_event(self):
+        """Вычисляет время до ближайшей смены состояния полосы."""
+        if self.current_request:
+            return self.request_completion_time
+        if self.status == 'busy':
+            return self.safety_time_gap
+        return None
 
-    def get_flight_history(self):
-        """Возвращает список обслуженных заявок."""
-        return self.flight_history
+    def skip_time(self, passed_time):
+        """Пропускает время, за которое состояние полосы не меняется."""
+        if self.current_request:
+            self.request_completion_time -= passed_time
+            self.occupancy_time += passed_time
+        elif self.status == 'busy':
+            self.safety_time_gap -= passed_time
 
 
-class Request:
-    """Заявка."""
+class RunwayBank:
+    """Набор полос, состояние которых хранится в массивах numpy.
 
-    def __init__(
+    Переходы всех полос за шаг вычисляются векторными выражениями и
+    совпадают с Runway.time_tick; обслуживаемые заявки хранятся в
+    отдельном списке, совершенные рейсы учитывает аэропорт.
+    Если задан replications_count, массивы двумерные (прогон x полоса)
+    и хранят полосы нескольких прогонов сразу, без самих заявок.
+    """
+
+    def __init__(self, runway_count, replications_count=None):
+        if numpy is None:
+            raise ImportError('Для набора полос RunwayBank требуется numpy')
+        shape = runway_count
+        if replications_count is not None:
+            shape = (replications_count, runway_count)
+        # занятость полос и наличие обрабатываемой заявки
+        self.busy = numpy.zeros(shape, dtype=bool)
+        self.has_request = numpy.zeros(shape, dtype=bool)
+        # оставшееся время выполнения заявки и окна безопасности
+        self.completion_times = numpy.zeros(shape, dtype=numpy.int64)
+        self.safety_time_gaps = numpy.zeros(shape, dtype=numpy.int64)
+        # время занятости полос
+        self.occupancy_times = numpy.zeros(shape, dtype=numpy.int64)
+        # обрабатываемые заявки
+        self.current_requests = None
+        if replications_count is None:
+            self.current_requests = [None] * runway_count
+
+    def __len__(self):
+        """Возвращает кол-во полос."""
+        return len(self.busy)
+
+    def time_tick(self, time_tick):
+        """Шаг работы всех полос, возвращает закрытые заявки с номерами."""
+        finished = self.advance(time_tick)
+        finished_requests = []
+        for runway_index in numpy.flatnonzero(finished).tolist():
+            finished_request = self.current_requests[runway_index]
+            finished_request.complete()
+            self.current_requests[runway_index] = None
+            finished_requests.append((runway_index, finished_request))
+        return finished_requests
+
+    def advance(self, time_tick):
+        """Шаг работы всех полос, возвращает маску закрытых заявок."""
+        remaining_times = time_tick - self.completion_times
+        due = self.busy & (remaining_times >= 0)
+        running = self.busy & ~due
+        finished = due & self.has_request
+        released = due & (remaining_times >= self.safety_time_gaps)
+
+        self.occupancy_times += numpy.where(
+            finished,
+            self.completion_times,
+            numpy.where(running, time_tick, 0),
+        )
+        self.completion_times = numpy.where(
+            running,
+            self.completion_times - time_tick,
+            numpy.where(due, 0, self.completion_times),
+        )
+        self.safety_time_gaps = numpy.where(
+            released,
+            0,
+            numpy.where(
+                due,
+                self.safety_time_gaps - remaining_times,
+                self.safety_time_gaps,
+            ),
+        )
+        self.busy &= ~released
+        self.has_request &= ~finished
+        return finished
+
+    def process_request(
+        self, runway_index, request, completion_time, safety_time_gap
+    ):
+        """Определяет возможность обслуживания заявки полосой."""
+        if self.busy[runway_index]:
+            return False
+        self.busy[runway_index] = True
+        self.has_request[runway_index] = True
+        self.current_requests[runway_index] = request
+        self.completion_times[runway_index] = completion_time
+        self.safety_time_gaps[runway_index] = safety_time_gap
+        return True
+
+    def start_requests(self, started, completion_times, safety_time_gap):
+        """Занимает полосы из маски started заявками без их учета."""
+        self.busy |= started
+        self.has_request |= started
+        self.completion_times = numpy.where(
+            started,
+            completion_times,
+            self.completion_times,
+        )
+        self.safety_time_gaps = numpy.where(
+            started,
+            safety_time_gap,
+            self.safety_time_gaps,
+        )
+
+    def get_free_runways(self):
+        """Возвращает номера свободных полос по возрастанию."""
+        return numpy.flatnonzero(~self.busy).tolist()
+
+    def get_time_to_event(self):
+        """Вычисляет время до ближайшей смены состояния полос или None."""
+        if not self.busy.any():
+            return None
+        times_to_event = numpy.where(
+            self.has_request,
+            self.completion_times,
+            self.safety_time_gaps,
+        )
+        return int(times_to_event[self.busy].min())
+
+    def get_statuses(self):
+        """Возвращает статусы занятости полос."""
+        return ['busy' if busy else 'free' for busy in self.busy.tolist()]
+
+    def get_avg_occupancies(self, passed_time):
+        """Вычисляет среднюю занятость полос."""
+        return (self.occupancy_times / passed_time).tolist()
+
+    def get_current_requests(self):
+        """Возвращает обрабатываемые заявки."""
+        return [
+            request for request in self.current_requests if request
+        ]
+
+
+class FinishedFlights:
+    """Совершенные рейсы в порядке времени окончания обслуживания.
+
+    Пополняется при закрытии заявок. Полосы закрывают заявки почти в
+    порядке времени окончания, поэтому запись вставляется бинарным поиском
+    в конец списка или рядом с ним, и пересортировка не нужна.
+    """
+
+    def __init__(self, limit=None):
+        # записи (время окончания, номер полосы, код типа заявки)
+        self.flights = []
+        # кол-во хранимых последних рейсов (None - все)
+        self.limit = limit
+        # изменения с прошлого чтения: кол-во удаленных из начала записей
+        # и номер первой измененной записи
+        self.released_count = 0
+        self.changed_index = 0
+
+    def add_flight(self, finish_time, runway_index, request_kind):
+        """Добавляет совершенный рейс."""
+        flight = (finish_time, runway_index, request_kind)
+        if self.flights and flight < self.flights[-1]:
+            flight_index = bisect_right(self.flights, flight)
+            self.flights.insert(flight_index, flight)
+            self.changed_index = min(self.changed_index, flight_index)
+        else:
+            self.flights.append(flight)
+        # старые записи удаляются пачками, когда их становится вдвое больше
+        if self.limit is not None and len(self.flights) >= 2 * self.limit:
+            excess_count = len(self.flights) - self.limit
+            del self.flights[:excess_count]
+            self.released_count += excess_count
+            self.changed_index = max(0, self.changed_index - excess_count)
+
+    def get_flights_count(self):
+        """Возвращает кол-во хранимых рейсов."""
+        return len(self.flights)
+
+    def get_flight_info_at(self, index, start_time):
+        """Возвращает информацию о рейсе по его номеру."""
+        return self.get_flight_info(
+            self.flights[index],
+            start_time[0] * 60 + start_time[1],
+        )
+
+    def find_flight_index(self, clock_time, start_time):
+        """Возвращает номер первого рейса, совершенного не раньше clock_time.
+
+        Ищется последнее наступление указанного времени суток, за которым
+        есть хранимые рейсы.
+        """
+        if not self.flights:
+            return 0
+        day_time = (
+            clock_time[0] * 60 + clock_time[1]
+            - start_time[0] * 60 - start_time[1]
+        ) % (24 * 60)
+        # сутки последнего рейса, в которых время суток уже наступило
+        search_time = self.flights[-1][0] // (24 * 60) * 24 * 60 + day_time
+        if search_time > self.flights[-1][0]:
+            search_time -= 24 * 60
+        return bisect_left(self.flights, (search_time,))
+
+    def get_flight_info(self, flight, start_time):
+        """Возвращает время суток, номер полосы и тип рейса."""
+        flight_time = (flight[0] + start_time) % (24 * 60)
+        return (
+            (flight_time // 60, flight_time % 60),
+            flight[1],
+            REQUEST_TYPE_NAMES[flight[2]],
+        )
+
+    def read_flights_info(self, start_time):
+        """Возвращает изменения списка рейсов с прошлого чтения.
+
+        Возвращает кол-во записей, удаленных из начала списка, номер
+        первой измененной записи и информацию о рейсах, начиная с нее.
+        """
+        true_start_time = start_time[0] * 60 + start_time[1]
+        released_count = self.released_count
+        changed_index = self.changed_index
+        self.released_count = 0
+        self.changed_index = len(self.flights)
+        return released_count, changed_index, [
+            self.get_flight_info(flight, true_start_time)
+            for flight in self.flights[changed_index:]
+        ]
+
+
+class RequestStore:
+    """Хранилище заявок.
+
+    Поля заявок хранятся по столбцам в компактных массивах, типы самолетов,
+    заявок и статусы - целочисленными кодами. Время обслуживания берется
+    из таблицы, собранной по типам самолетов при создании хранилища.
+    """
+
+    def __init__(self, plane_types):
+        # коды типов самолетов и время обслуживания по кодам
+        self.plane_type_names, self.service_time_table = (
+            plane_types.compile_service_times()
+        )
+        self.plane_type_codes = {
+            plane_type: code
+            for code, plane_type in enumerate(self.plane_type_names)
+        }
+
+        # столбцы полей заявок
+        self.plane_types = array('H')
+        self.request_types = array('b')
+        self.statuses = array('b')
+        self.time_variances = array('i')
+        self.submission_times = array('i')
+        self.waiting_times = array('i')
+        self.service_times = array('i')
+        # кол-во освобожденных заявок в начале хранилища
+        self.released_count = 0
+
+    def __len__(self):
+        """Возвращает кол-во заявок в хранилище."""
+        return len(self.statuses)
+
+    def get_requests_count(self):
+        """Возвращает кол-во заявок, поступивших за все время."""
+        return self.released_count + len(self.statuses)
+
+    def release_requests(self, first_needed_index):
+        """Удаляет заявки с номерами меньше first_needed_index."""
+        release_count = first_needed_index - self.released_count
+        if release_count <= 0:
+            return
+        for column in (
+            self.plane_types,
+            self.request_types,
+            self.statuses,
+            self.time_variances,
+            self.submission_times,
+            self.waiting_times,
+            self.service_times,
+        ):
+            del column[:release_count]
+        self.released_count = first_needed_index
+
+    def add_request(
         self, plane_type, request_type, time_variance, submission_time
     ):
-        # входные параметры
-        # получены от агрегирующего класса (диспетчера)
-        self.plane_type = plane_type
-        self.request_type = request_type
-        self.time_variance = time_variance
-        self.submission_time = submission_time
+        """Добавляет заявку и возвращает ее представление."""
+        plane_type_code = self.plane_type_codes[plane_type]
+        request_kind = REQUEST_TYPE_CODES[request_type]
+        self.plane_types.append(plane_type_code)
+        self.request_types.append(request_kind)
+        self.statuses.append(WAITING)
+        self.time_variances.append(time_variance)
+        self.submission_times.append(submission_time)
+        self.waiting_times.append(0)
+        self.service_times.append(
+            self.service_time_table[plane_type_code][request_kind]
+        )
+        return Request(self, self.get_requests_count() - 1)
+
+    def get_request(self, index):
+        """Возвращает представление заявки по ее номеру."""
+        return Request(self, index)
+
+
+class Request:
+    """Заявка.
+
+    Легковесное представление строки хранилища заявок.
+    """
 
-        # статус заявки: ok/wait
-        self.status = 'wait'
-        # время ожидания
-        self.waiting_time = 0
+    __slots__ = ('store', 'index')
 
-    def get_request_type(self):
-        """Возвращает тип заявки."""
-        return self.request_type
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    def get_row(self):
+        """Возвращает номер строки заявки в столбцах хранилища."""
+        return self.index - self.store.released_count
+
+    def get_index(self):
+        """Возвращает номер заявки в хранилище."""
+        return self.index
+
+    def get_request_kind(self):
+        """Возвращает код типа заявки."""
+        return self.store.request_types[self.get_row()]
+
+    def get_service_time(self):
+        """Возвращает время обслуживания заявки на полосе."""
+        return self.store.service_times[self.get_row()]
 
     def get_status(self):
         """Возвращает статус заявки."""
-        return self.status
+        return STATUS_NAMES[self.store.statuses[self.get_row()]]
 
-    def get_plane_type(self):
-        """Возвращает тип самолета."""
-        return self.plane_type
+    def get_time_variance(self):
+        """Возвращает отклонение от расписания."""
+        return self.store.time_variances[self.get_row()]
+
+    def get_submission_time(self):
+        """Возвращает время подачи заявки."""
+        return self.store.submission_times[self.get_row()]
 
     def get_time_delay(self):
         """Подсчитывает величину задержки."""
-        return self.time_variance + self.waiting_time
+        row = self.get_row()
+        return self.store.time_variances[row] + self.store.waiting_times[row]
 
     def get_process_time(self):
         """Возвращает время начала выполнения заявки."""
-        return self.submission_time + self.waiting_time
+        row = self.get_row()
+        return self.store.submission_times[row] + self.store.waiting_times[row]
 
-    def update_status(self, new_status):
-        """Обновляет статус заявки."""
-        self.status = new_status
+    def complete(self):
+        """Закрывает заявку."""
+        self.store.statuses[self.get_row()] = COMPLETED
 
     def update_waiting_time(self, passed_time):
         """Обновляет время ожидания заявки."""
-        if self.status == 'wait':
-            self.waiting_time += passed_time
+        row = self.get_row()
+        if self.store.statuses[row] == WAITING:
+            self.store.waiting_times[row] += passed_time
 
 
 class Schedule:
-    """Расписание полетов."""
+    """Расписание полетов.
+
+    Рейсы хранятся отсортированными по времени суток (рейсы с одинаковым
+    временем - в порядке добавления), поэтому новый рейс вставляется
+    бинарным поиском, а расписание, начинающееся с момента старта,
+    получается без пересортировки.
+    """
 
     def __init__(self):
         self.schedule = []
+        # время рейсов в минутах от начала суток, в порядке self.schedule
+        self.flight_minutes = []
         # дефолтные настройки расписания полетов
         self.default_settings = [
             ('glider', 'посадка', (6, 35)),
@@ -319,44 +877,176 @@ class Schedule:
         self.default_used = False
 
     def get_schedule(self):
-        """Возвращает существующее расписание полетов."""
+        """Возвращает рейсы, упорядоченные по времени суток."""
         return self.schedule
 
+    def get_start_index(self, start_time):
+        """Возвращает номер первого рейса не раньше момента старта."""
+        start_index = bisect_left(
+            self.flight_minutes,
+            start_time[0] * 60 + start_time[1],
+        )
+        if start_index == len(self.schedule):
+            return 0
+        return start_index
+
+    def get_rotated_flight(self, index, start_time):
+        """Возвращает рейс по позиции в расписании от момента старта."""
+        start_index = self.get_start_index(start_time)
+        return self.schedule[(start_index + index) % len(self.schedule)]
+
+    def get_rotated_flight_index(self, scheduled_time, start_time):
+        """Возвращает позицию последнего рейса с указанным временем.
+
+        Позиция отсчитывается в расписании, начинающемся с момента старта.
+        """
+        flight_index = bisect_right(
+            self.flight_minutes,
+            scheduled_time[0] * 60 + scheduled_time[1],
+        ) - 1
+        start_index = self.get_start_index(start_time)
+        return (flight_index - start_index) % len(self.schedule)
+
+    def find_rotated_flight_index(self, scheduled_time, start_time):
+        """Возвращает позицию первого рейса не раньше указанного времени.
+
+        Позиция отсчитывается в расписании, начинающемся с момента старта;
+        если таких рейсов нет, возвращается позиция первого рейса суток.
+        """
+        if not self.schedule:
+            return 0
+        flight_index = bisect_left(
+            self.flight_minutes,
+            scheduled_time[0] * 60 + scheduled_time[1],
+        )
+        start_index = self.get_start_index(start_time)
+        return (flight_index - start_index) % len(self.schedule)
+
+    def set_flights(self, flights):
+        """Заменяет рейсы расписания, упорядочивая их по времени суток."""
+        self.schedule = sorted(flights, key=lambda flight: flight[-1])
+        self.flight_minutes = [
+            flight[-1][0] * 60 + flight[-1][1] for flight in self.schedule
+        ]
+
     def clear_schedule(self):
         """Стирает расписание."""
-        self.schedule = []
+        self.set_flights([])
         self.default_used = False
 
     def add_flight(self, plane_type, request_type, scheduled_time):
         """Добавляет рейс в расписание."""
         # проверка корректности данных
-        try:
-            time_struct = time.strptime(scheduled_time, '%H:%M')
-        except ValueError:
+        parsed_time = parse_clock_time(scheduled_time)
+        if parsed_time is None:
             return False
-        parsed_time = (time_struct.tm_hour, time_struct.tm_min)
         # рейс: (тип самолета, тип заявки, (часы, минуты))
-        self.schedule.append((plane_type, request_type, parsed_time))
+        flight_minute = parsed_time[0] * 60 + parsed_time[1]
+        flight_index = bisect_right(self.flight_minutes, flight_minute)
+        self.schedule.insert(
+            flight_index,
+            (plane_type, request_type, parsed_time),
+        )
+        self.flight_minutes.insert(flight_index, flight_minute)
         return True
 
-    def sort_schedule(self, start_time):
-        """Сортирует рейсы по запланированному времени."""
-        self.schedule.sort(key=lambda flight: flight[-1])
-        if len(self.schedule):
-            partition_index = 0
-            for i in range(len(self.schedule)):
-                if self.schedule[i][-1] >= start_time:
-                    partition_index = i
-                    break
-            partition_part = self.schedule[:partition_index]
-            true_sorted_schedule = self.schedule[partition_index:]
-            self.schedule = true_sorted_schedule
-            self.schedule.extend(partition_part)
+    def load_flights(self, file_path, plane_types):
+        """Загружает рейсы из файла CSV или JSON.
+
+        Строка CSV: тип самолета, тип заявки, время в формате чч:мм;
+        первой может идти строка заголовка plane_type,request_type,time.
+        JSON - список таких же троек или объектов с этими ключами.
+        Рейсы добавляются, только если все строки корректны; иначе
+        возвращается список всех ошибок (номер строки, описание).
+        """
+        if file_path.lower().endswith('.json'):
+            with open(file_path, encoding='utf-8-sig') as schedule_file:
+                rows = json.load(schedule_file)
+            if not isinstance(rows, list):
+                return [(0, 'ожидается список рейсов')]
+            return self.add_flights(rows, plane_types, first_row_number=1)
+        # utf-8-sig пропускает BOM в файлах, сохраненных из Excel
+        with open(
+            file_path,
+            encoding='utf-8-sig',
+            newline='',
+        ) as schedule_file:
+            try:
+                return self.add_flights(
+                    csv.reader(schedule_file),
+                    plane_types,
+                    first_row_number=1,
+                    skip_header=True,
+                )
+            except csv.Error:
+                # например, поле длиннее csv.field_size_limit()
+                return [(0, 'не удалось прочитать файл')]
+
+    def add_flights(
+        self, rows, plane_types, first_row_number=1, skip_header=False
+    ):
+        """Добавляет рейсы из последовательности строк одним проходом.
+
+        Возвращает список всех ошибок (номер строки, описание); при
+        наличии ошибок расписание не меняется.
+        """
+        # одни и те же строки типов используются всеми рейсами
+        plane_type_names = {
+            type_name: type_name
+            for type_name in plane_types.get_plane_types()
+        }
+        request_type_names = {
+            type_name: type_name for type_name in REQUEST_TYPE_CODES
+        }
+        # разобранное время по исходной строке
+        parsed_times = dict()
+        flights = []
+        errors = []
+        for row_number, row in enumerate(rows, first_row_number):
+            if isinstance(row, dict):
+                row = tuple(row.get(field) for field in SCHEDULE_FIELDS)
+            if not isinstance(row, (list, tuple)) or len(row) != 3:
+                errors.append((row_number, 'ожидается 3 поля'))
+                continue
+            # заголовок пропускается, только если совпадает с именами полей:
+            # некорректная первая строка данных должна попасть в ошибки
+            if (
+                skip_header
+                and row_number == first_row_number
+                and tuple(row) == SCHEDULE_FIELDS
+            ):
+                continue
+            # в JSON поля могут быть любого типа, в том числе нехешируемого
+            plane_type = None
+            if isinstance(row[0], str):
+                plane_type = plane_type_names.get(row[0])
+            request_type = None
+            if isinstance(row[1], str):
+                request_type = request_type_names.get(row[1])
+            scheduled_time = row[2]
+            parsed_time = None
+            if isinstance(scheduled_time, str):
+                if scheduled_time not in parsed_times:
+                    parsed_times[scheduled_time] = parse_clock_time(
+                        scheduled_time,
+                    )
+                parsed_time = parsed_times[scheduled_time]
+            if plane_type is None:
+                errors.append((row_number, 'неизвестный тип самолета'))
+            elif request_type is None:
+                errors.append((row_number, 'неизвестный тип заявки'))
+            elif parsed_time is None:
+                errors.append((row_number, 'некорректный формат времени'))
+            else:
+                flights.append((plane_type, request_type, parsed_time))
+        if not errors:
+            self.set_flights(self.schedule + flights)
+        return errors
 
     def use_default_settings(self, plane_types):
         """Использует дефолтное, заранее заданное расписание."""
         if plane_types.is_default_used():
-            self.schedule = self.default_settings.copy()
+            self.set_flights(self.default_settings)
             self.default_used = True
 
     def is_default_used(self):
@@ -396,6 +1086,23 @@ class PlaneTypes:
             return True
         return False
 
+    def compile_service_times(self):
+        """Собирает типы самолетов в плотную таблицу времени обслуживания.
+
+        Возвращает список имен типов (код типа == индекс) и таблицу, в
+        которой время обслуживания индексируется кодом типа самолета и
+        кодом типа заявки.
+        """
+        type_names = list(self.types)
+        service_time_table = []
+        for type_name in type_names:
+            takeoff_time, landing_time = self.types[type_name]
+            service_times = [0, 0]
+            service_times[LANDING] = landing_time
+            service_times[TAKEOFF] = takeoff_time
+            service_time_table.append(tuple(service_times))
+        return type_names, service_time_table
+
     def is_existing_type(self, type_name):
         """Проверяет тип на наличие в базе типов."""
         if type_name in self.types:
@@ -410,3 +1117,940 @@ class PlaneTypes:
     def is_default_used(self):
         """Проверяет, были ли использованы дефолтные настройки."""
         return self.default_used
+
+
+class Statistics:
+    """Статистика работы аэропорта.
+
+    Обновляется при поступлении, назначении на полосу и закрытии заявок,
+    поэтому чтение текущих значений не требует обхода всех заявок.
+    Кроме итогов за все время, ведется статистика за скользящее окно
+    window_length минут, разбитое на интервалы по window_bucket_length
+    минут; хранятся только интервалы, попадающие в окно.
+    """
+
+    def __init__(self, window_length=24 * 60, window_bucket_length=60):
+        # кол-во обслуженных заявок
+        self.completed_requests = 0
+        # кол-во поступивших заявок на взлет
+        self.takeoff_requests_count = 0
+        # задержки заявок на взлет, уже назначенных на полосы
+        self.max_dispatched_delay = 0
+        self.total_dispatched_delay = 0
+        # заявки на взлет в очереди: задержка == текущее время + смещение,
+        # где смещение == отклонение от расписания - время подачи заявки
+        self.queued_takeoff_count = 0
+        self.total_queued_delay_offset = 0
+        # монотонная очередь (номер заявки, смещение) для максимума
+        self.max_queued_delay_offsets = deque()
+
+        # статистика по очередям
+        self.max_landing_queue = 0
+        self.max_takeoff_queue = 0
+        self.total_landing_queue = 0
+        self.total_takeoff_queue = 0
+
+        # статистика за скользящее окно
+        self.current_time = 0
+        self.window_bucket_length = window_bucket_length
+        self.window_buckets_count = ceil(window_length / window_bucket_length)
+        # интервалы окна: [номер интервала, обслужено заявок,
+        # назначено заявок на взлет, сумма и максимум их задержек,
+        # сумма длин очередей на посадку и на взлет, кол-во шагов]
+        self.window_buckets = deque(maxlen=self.window_buckets_count)
+
+    def set_current_time(self, current_time):
+        """Устанавливает текущее время для статистики за окно."""
+        self.current_time = current_time
+
+    def get_window_bucket_number(self, time):
+        """Возвращает номер интервала окна для момента времени."""
+        return max(0, time - 1) // self.window_bucket_length
+
+    def get_window_bucket(self, time):
+        """Возвращает интервал окна, содержащий указанный момент времени."""
+        bucket_number = self.get_window_bucket_number(time)
+        if (
+            not self.window_buckets
+            or self.window_buckets[-1][0] < bucket_number
+        ):
+            self.window_buckets.append([bucket_number, 0, 0, 0, 0, 0, 0, 0])
+        return self.window_buckets[-1]
+
+    def add_request(self, request):
+        """Учитывает поступившую в очередь заявку."""
+        if request.get_request_kind() != TAKEOFF:
+            return
+        self.takeoff_requests_count += 1
+        self.queued_takeoff_count += 1
+        delay_offset = (
+            request.get_time_variance() - request.get_submission_time()
+        )
+        self.total_queued_delay_offset += delay_offset
+        while (
+            self.max_queued_delay_offsets
+            and self.max_queued_delay_offsets[-1][1] <= delay_offset
+        ):
+            self.max_queued_delay_offsets.pop()
+        self.max_queued_delay_offsets.append(
+            (request.get_index(), delay_offset)
+        )
+
+    def dispatch_request(self, request):
+        """Учитывает назначение заявки на полосу."""
+        if request.get_request_kind() != TAKEOFF:
+            return
+        self.queued_takeoff_count -= 1
+        self.total_queued_delay_offset -= (
+            request.get_time_variance() - request.get_submission_time()
+        )
+        if (
+            self.max_queued_delay_offsets
+            and self.max_queued_delay_offsets[0][0] == request.get_index()
+        ):
+            self.max_queued_delay_offsets.popleft()
+        delay = request.get_time_delay()
+        self.total_dispatched_delay += delay
+        if delay > self.max_dispatched_delay:
+            self.max_dispatched_delay = delay
+
+        window_bucket = self.get_window_bucket(self.current_time)
+        window_bucket[2] += 1
+        window_bucket[3] += delay
+        if delay > window_bucket[4]:
+            window_bucket[4] = delay
+
+    def complete_request(self, request):
+        """Учитывает обслуженную заявку."""
+        self.completed_requests += 1
+        self.get_window_bucket(self.current_time)[1] += 1
+
+    def update_queue_length(
+        self, landing_queue, takeoff_queue, time_ticks_count=1, time_tick=0
+    ):
+        """Учитывает длины очередей на В/П за прошедшие шаги.
+
+        Шаги длиной time_tick заканчиваются в текущий момент времени;
+        по ним несколько шагов раскладываются по интервалам окна.
+        """
+        if landing_queue > self.max_landing_queue:
+            self.max_landing_queue = landing_queue
+        if takeoff_queue > self.max_takeoff_queue:
+            self.max_takeoff_queue = takeoff_queue
+        self.total_landing_queue += landing_queue * time_ticks_count
+        self.total_takeoff_queue += takeoff_queue * time_ticks_count
+
+        # в окно попадают только последние шаги
+        window_length = self.window_buckets_count * self.window_bucket_length
+        if time_tick > 0:
+            time_ticks_count = min(
+                time_ticks_count,
+                ceil(window_length / time_tick) + 1,
+            )
+        tick_time = self.current_time - time_tick * (time_ticks_count - 1)
+        while time_ticks_count > 0:
+            window_bucket = self.get_window_bucket(tick_time)
+            # кол-во шагов, заканчивающихся в том же интервале
+            if time_tick > 0:
+                bucket_end_time = (
+                    (window_bucket[0] + 1) * self.window_bucket_length
+                )
+                bucket_ticks_count = min(
+                    time_ticks_count,
+                    (bucket_end_time - tick_time) // time_tick + 1,
+                )
+            else:
+                bucket_ticks_count = time_ticks_count
+            window_bucket[5] += landing_queue * bucket_ticks_count
+            window_bucket[6] += takeoff_queue * bucket_ticks_count
+            window_bucket[7] += bucket_ticks_count
+            time_ticks_count -= bucket_ticks_count
+            tick_time += time_tick * bucket_ticks_count
+
+    def get_completed_requests_count(self):
+        """Возвращает кол-во обслуженных заявок."""
+        return self.completed_requests
+
+    def get_max_delay(self, current_time):
+        """Возвращает максимальную задержку заявок на взлет."""
+        max_delay = self.max_dispatched_delay
+        if self.max_queued_delay_offsets:
+            queued_delay = current_time + self.max_queued_delay_offsets[0][1]
+            if queued_delay > max_delay:
+                max_delay = queued_delay
+        return max_delay
+
+    def get_avg_delay(self, current_time):
+        """Вычисляет среднюю задержку заявок на взлет."""
+        if self.takeoff_requests_count == 0:
+            return 0
+        total_delay = (
+            self.total_dispatched_delay
+            + self.queued_takeoff_count * current_time
+            + self.total_queued_delay_offset
+        )
+        return total_delay / self.takeoff_requests_count
+
+    def get_max_queue_length(self):
+        """Возвращает максимальные длины очередей на В/П."""
+        return self.max_landing_queue, self.max_takeoff_queue
+
+    def get_avg_queue_length(self, passed_time_ticks):
+        """Вычисляет средние длины очередей на В/П."""
+        avg_landing_queue = self.total_landing_queue / passed_time_ticks
+        avg_takeoff_queue = self.total_takeoff_queue / passed_time_ticks
+        return avg_landing_queue, avg_takeoff_queue
+
+    def get_window_stats(self):
+        """Возвращает статистику за скользящее окно."""
+        totals = [0] * 8
+        first_bucket_number = (
+            self.get_window_bucket_number(self.current_time)
+            - self.window_buckets_count
+            + 1
+        )
+        for window_bucket in self.window_buckets:
+            if window_bucket[0] < first_bucket_number:
+                continue
+            for i in (1, 2, 3, 5, 6, 7):
+                totals[i] += window_bucket[i]
+            totals[4] = max(totals[4], window_bucket[4])
+        dispatched_takeoffs, time_ticks_count = totals[2], totals[7]
+        return {
+            'window_length': (
+                self.window_buckets_count * self.window_bucket_length
+            ),
+            'completed_requests': totals[1],
+            'max_delay': totals[4],
+            'avg_delay': (
+                totals[3] / dispatched_takeoffs if dispatched_takeoffs else 0
+            ),
+            'avg_landing_queue': (
+                totals[5] / time_ticks_count if time_ticks_count else 0
+            ),
+            'avg_takeoff_queue': (
+                totals[6] / time_ticks_count if time_ticks_count else 0
+            ),
+        }
+
+
+class SimulationEngine:
+    """Движок моделирования работы аэропорта без графического интерфейса."""
+
+    def __init__(
+        self,
+        plane_preparation_time,
+        flight_schedule,
+        runway_count,
+        safety_time_gap,
+        schedule_variance,
+        time_tick,
+        start_time,
+        seed=None,
+        vectorized=False,
+        days=1,
+        flight_history_limit=None,
+        runway_bank=False,
+    ):
+        # входные параметры
+        # получены от пользователя (через GUI или напрямую)
+        self.plane_preparation_time = plane_preparation_time
+        self.flight_schedule = flight_schedule
+        self.runway_count = runway_count
+        self.safety_time_gap = safety_time_gap
+        # отклонение от расписания (min_variance, max_variance)
+        self.schedule_variance = schedule_variance
+        # шаг моделирования
+        self.time_tick = time_tick
+        # время начала моделирования (часы, минуты)
+        self.start_time = start_time
+        # генератор случайных чисел
+        self.seed = seed
+        self.rng = Random(seed)
+        # генерация отклонений одним вызовом numpy
+        if vectorized and numpy is None:
+            raise ImportError('Для векторизованной генерации требуется numpy')
+        self.vectorized = vectorized
+        self.numpy_rng = numpy.random.default_rng(seed) if vectorized else None
+        # кол-во моделируемых суток (None - без ограничения);
+        # расписание повторяется каждые сутки
+        self.days = days
+        # в многосуточном режиме хранятся только последние рейсы полос
+        if flight_history_limit is None and days != 1:
+            flight_history_limit = FLIGHT_HISTORY_LIMIT
+
+        # состояние модели
+        # прошедшее время в минутах
+        self.current_time = 0
+        # кол-во прошедших шагов
+        self.passed_time_ticks = 0
+        # продолжительность моделирования в минутах (None - без ограничения)
+        self.duration = None if days is None else days * 24 * 60
+        # аэропорт; полосы в массивах numpy, если задан runway_bank
+        airport_class = RunwayBankAirport if runway_bank else Airport
+        self.airport = airport_class(
+            self.plane_preparation_time,
+            self.runway_count,
+            self.safety_time_gap,
+            flight_history_limit,
+        )
+        # время полетов с учетом отклонений
+        self.true_flight_time_list = []
+        # индекс следующего невыпущенного рейса
+        self.next_flight_index = 0
+        # кол-во суток, для которых уже создано расписание
+        self.scheduled_days = 0
+
+        # создание списка полетов с учетом отклонений
+        self.create_true_schedule()
+        self.extend_true_schedule()
+
+    def is_finished(self):
+        """Проверяет, закончено ли моделирование."""
+        if self.duration is None:
+            return False
+        return self.current_time >= self.duration
+
+    def step(self, time_tick=None):
+        """Шаг моделирования."""
+        if self.is_finished():
+            return False
+        # шаг моделирования может меняться в процессе работы
+        if time_tick is not None:
+            self.time_tick = time_tick
+        self.current_time += self.time_tick
+        self.passed_time_ticks += 1
+
+        pending_requests = self.generate_requests()
+        self.airport.add_to_request_queue(pending_requests)
+        self.airport.time_tick(self.time_tick)
+        return True
+
+    def run_to_end(self):
+        """Вычисляет все оставшиеся шаги моделирования."""
+        if self.duration is None:
+            raise ValueError('Моделирование без ограничения не имеет конца')
+        while self.step():
+            pass
+
+    def run_until(self, end_time, time_tick=None):
+        """Вычисляет шаги моделирования до указанного момента времени."""
+        while self.current_time < end_time and self.step(time_tick):
+            pass
+
+    def get_progress(self):
+        """Возвращает долю пройденного времени моделирования."""
+        if self.duration is None:
+            return 0
+        return min(1, self.current_time / self.duration)
+
+    def get_day(self):
+        """Возвращает номер текущих суток моделирования (с нуля)."""
+        return max(0, self.current_time - 1) // (24 * 60)
+
+    def get_clock_time(self):
+        """Возвращает текущее время суток (часы, минуты)."""
+        current_time = (
+            self.start_time[0] * 60 + self.start_time[1] + self.current_time
+        )
+        current_time %= 24 * 60
+        return current_time // 60, current_time % 60
+
+    def get_stats(self):
+        """Возвращает снимок текущей статистики модели."""
+        cur_landing_queue, cur_takeoff_queue = (
+            self.airport.get_current_queue_length()
+        )
+        max_landing_queue, max_takeoff_queue = self.airport.get_queue_stats()
+        if self.passed_time_ticks:
+            avg_landing_queue, avg_takeoff_queue = (
+                self.airport.get_avg_queue_length(self.passed_time_ticks)
+            )
+            runway_occupancy = self.airport.get_runway_occupancy_stats(
+                self.current_time,
+            )
+        else:
+            avg_landing_queue, avg_takeoff_queue = 0, 0
+            runway_occupancy = [0] * self.runway_count
+
+        statistics = self.airport.statistics
+
+        return {
+            'current_time': self.get_clock_time(),
+            'cur_landing_queue': cur_landing_queue,
+            'cur_takeoff_queue': cur_takeoff_queue,
+            'max_landing_queue': max_landing_queue,
+            'max_takeoff_queue': max_takeoff_queue,
+            'avg_landing_queue': avg_landing_queue,
+            'avg_takeoff_queue': avg_takeoff_queue,
+            'runway_statuses': self.airport.get_runway_statuses(),
+            'runway_occupancy': runway_occupancy,
+            'completed_requests': statistics.get_completed_requests_count(),
+            'max_delay': statistics.get_max_delay(self.current_time),
+            'avg_delay': statistics.get_avg_delay(self.current_time),
+            'day': self.get_day(),
+            'window': statistics.get_window_stats(),
+        }
+
+    def get_finished_flights_count(self):
+        """Возвращает кол-во хранимых совершенных рейсов."""
+        return self.airport.finished_flights.get_flights_count()
+
+    def get_finished_flight(self, index):
+        """Возвращает информацию о совершенном рейсе по его номеру."""
+        return self.airport.finished_flights.get_flight_info_at(
+            index,
+            self.start_time,
+        )
+
+    def find_finished_flight(self, clock_time):
+        """Возвращает номер первого рейса не раньше указанного времени."""
+        return self.airport.finished_flights.find_flight_index(
+            clock_time,
+            self.start_time,
+        )
+
+    def read_finished_flights(self):
+        """Возвращает изменения списка совершенных рейсов с прошлого чтения.
+
+        Возвращает кол-во рейсов, удаленных из начала списка, номер
+        первого измененного рейса и рейсы, начиная с него.
+        """
+        return self.airport.read_finished_requests_info(self.start_time)
+
+    def create_true_schedule(self):
+        """Добавляет к расписанию очередные сутки с учетом отклонений.
+
+        Выпущенные рейсы из списка удаляются, поэтому его длина не
+        превышает двух суток расписания.
+        """
+        if self.vectorized:
+            day_flight_time_list = self.create_true_schedule_vectorized()
+        else:
+            day_flight_time_list = self.create_day_schedule()
+        day_offset = self.scheduled_days * 24 * 60
+        if day_offset:
+            day_flight_time_list = [
+                (flight[0], flight[1], flight[2], flight[3] + day_offset)
+                for flight in day_flight_time_list
+            ]
+        # отклонения могут переставить рейсы соседних суток
+        self.true_flight_time_list = list(merge(
+            self.true_flight_time_list[self.next_flight_index:],
+            day_flight_time_list,
+            key=lambda flight: flight[-1],
+        ))
+        self.next_flight_index = 0
+        self.scheduled_days += 1
+
+    def get_schedule_extension_time(self):
+        """Вычисляет момент, когда нужно расписание следующих суток."""
+        if self.days is not None and self.scheduled_days >= self.days:
+            return None
+        # раньше всего рейс может прибыть на max_variance минут
+        return self.scheduled_days * 24 * 60 - self.schedule_variance[1]
+
+    def extend_true_schedule(self):
+        """Создает расписание суток, рейсы которых уже могут прибыть."""
+        extension_time = self.get_schedule_extension_time()
+        while (
+            extension_time is not None
+            and extension_time <= self.current_time
+        ):
+            self.create_true_schedule()
+            extension_time = self.get_schedule_extension_time()
+
+    def create_day_schedule(self):
+        """Создает расписание одних суток с учетом отклонений."""
+        day_flight_time_list = []
+        distribution_radius = (
+            (self.schedule_variance[1] - self.schedule_variance[0]) / 2
+        )
+        distribution_center = self.schedule_variance[1] - distribution_radius
+        start_time = self.start_time[0] * 60 + self.start_time[1]
+
+        schedule = self.flight_schedule.get_schedule()
+        for flight in schedule:
+            flight_time = flight[-1][0] * 60 + flight[-1][1] - start_time
+            if flight_time < 0:
+                flight_time += 24 * 60
+
+            random_variance = round(
+                self.rng.gauss(
+                    mu=0.0,
+                    sigma=1.0,
+                ) * distribution_radius / 3 + distribution_center
+            )
+            if random_variance > self.schedule_variance[1]:
+                random_variance = self.schedule_variance[1]
+            if random_variance < self.schedule_variance[0]:
+                random_variance = self.schedule_variance[0]
+            is_negative = self.rng.randint(0, 1)
+            if is_negative:
+                random_variance *= (-1)
+            if flight[1] == 'взлет':
+                random_variance = abs(random_variance)
+
+            flight_time += random_variance
+            true_flight = (flight[0], flight[1], random_variance, flight_time)
+            day_flight_time_list.append(true_flight)
+
+        day_flight_time_list.sort(key=lambda flight: flight[-1])
+        return day_flight_time_list
+
+    def create_true_schedule_vectorized(self):
+        """Создает расписание одних суток средствами numpy."""
+        min_variance, max_variance = self.schedule_variance
+        distribution_radius = (max_variance - min_variance) / 2
+        distribution_center = max_variance - distribution_radius
+        start_time = self.start_time[0] * 60 + self.start_time[1]
+
+        schedule = self.flight_schedule.get_schedule()
+        flight_count = len(schedule)
+        flight_times = numpy.array(
+            [flight[-1][0] * 60 + flight[-1][1] for flight in schedule],
+            dtype=numpy.int64,
+        ) - start_time
+        flight_times[flight_times < 0] += 24 * 60
+        is_takeoff = numpy.array(
+            [flight[1] == 'взлет' for flight in schedule],
+            dtype=bool,
+        )
+
+        # все отклонения суток генерируются одним вызовом
+        rng = self.numpy_rng
+        random_variances = numpy.rint(
+            rng.standard_normal(flight_count) * distribution_radius / 3
+            + distribution_center
+        ).astype(numpy.int64)
+        numpy.clip(
+            random_variances,
+            min_variance,
+            max_variance,
+            out=random_variances,
+        )
+        is_negative = rng.integers(0, 2, size=flight_count).astype(bool)
+        random_variances[is_negative & ~is_takeoff] *= -1
+
+        flight_times += random_variances
+        order = numpy.argsort(flight_times, kind='stable')
+        return [
+            (schedule[i][0], schedule[i][1], random_variance, flight_time)
+            for i, random_variance, flight_time in zip(
+                order.tolist(),
+                random_variances[order].tolist(),
+                flight_times[order].tolist(),
+            )
+        ]
+
+    def generate_requests(self):
+        """Генерация заявок, время подачи которых уже наступило."""
+        self.extend_true_schedule()
+        pending_requests = []
+        request_store = self.airport.request_store
+        while self.next_flight_index < len(self.true_flight_time_list):
+            flight = self.true_flight_time_list[self.next_flight_index]
+            waiting_time = self.current_time - flight[-1]
+            if waiting_time < 0:
+                break
+            new_request = request_store.add_request(
+                flight[0],
+                flight[1],
+                flight[2],
+                flight[-1],
+            )
+            new_request.update_waiting_time(waiting_time)
+            pending_requests.append(new_request)
+            self.next_flight_index += 1
+        return pending_requests
+
+
+class EventSimulationEngine(SimulationEngine):
+    """Событийный движок моделирования.
+
+    Переходит сразу к ближайшему шагу, на котором прибывает заявка или
+    меняется состояние полосы, пропуская шаги без событий. Статистика
+    совпадает со статистикой пошагового движка на тех же шагах.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # номер последнего шага моделирования (None - без ограничения)
+        self.last_time_tick = None
+        if self.duration is not None:
+            self.last_time_tick = ceil(self.duration / self.time_tick)
+
+    def step(self, time_tick=None):
+        """Переход к ближайшему шагу с событием."""
+        if self.is_finished():
+            return False
+        if time_tick is not None and time_tick != self.time_tick:
+            raise ValueError(
+                'Событийный движок не поддерживает смену шага моделирования'
+            )
+        self.process_next_event()
+        return True
+
+    def run_to_end(self):
+        """Вычисляет все оставшиеся события моделирования."""
+        if self.duration is None:
+            raise ValueError('Моделирование без ограничения не имеет конца')
+        while not self.is_finished():
+            self.process_next_event()
+
+    def run_until(self, end_time, time_tick=None):
+        """Вычисляет события моделирования до указанного момента времени."""
+        if time_tick is not None and time_tick != self.time_tick:
+            raise ValueError(
+                'Событийный движок не поддерживает смену шага моделирования'
+            )
+        # шаг, на котором заканчивается end_time, обрабатывается
+        # даже без событий, чтобы время модели дошло до end_time
+        end_time_tick = ceil(end_time / self.time_tick)
+        while self.current_time < end_time and not self.is_finished():
+            self.process_next_event(end_time_tick)
+
+    def get_release_tick(self, flight_time):
+        """Вычисляет номер шага, на котором рейс подает заявку."""
+        return max(1, ceil(flight_time / self.time_tick))
+
+    def get_next_event_tick(self, max_event_tick=None):
+        """Вычисляет номер ближайшего шага с событием."""
+        next_event_tick = self.last_time_tick
+        if next_event_tick is None or (
+            max_event_tick is not None and max_event_tick < next_event_tick
+        ):
+            next_event_tick = max_event_tick
+        extension_time = self.get_schedule_extension_time()
+        if extension_time is not None:
+            extension_tick = self.get_release_tick(extension_time)
+            if next_event_tick is None or extension_tick < next_event_tick:
+                next_event_tick = extension_tick
+        if self.next_flight_index < len(self.true_flight_time_list):
+            flight = self.true_flight_time_list[self.next_flight_index]
+            next_event_tick = min(
+                next_event_tick,
+                self.get_release_tick(flight[-1]),
+            )
+        runway_event_time = self.airport.get_next_runway_event_time()
+        if runway_event_time is not None:
+            next_event_tick = min(
+                next_event_tick,
+                self.get_release_tick(runway_event_time),
+            )
+        return next_event_tick
+
+    def process_next_event(self, max_event_tick=None):
+        """Обрабатывает ближайший шаг с событием."""
+        event_tick = self.get_next_event_tick(max_event_tick)
+        # без ограничения по времени событие есть всегда: начало суток
+        event_tick = max(event_tick, self.passed_time_ticks + 1)
+
+        # на пропущенных шагах длины очередей не менялись
+        skipped_ticks = event_tick - self.passed_time_ticks - 1
+        if skipped_ticks > 0:
+            self.airport.set_current_time((event_tick - 1) * self.time_tick)
+            self.airport.update_queue_stats(skipped_ticks, self.time_tick)
+        self.passed_time_ticks = event_tick
+        self.current_time = event_tick * self.time_tick
+        self.airport.set_current_time(self.current_time)
+
+        # прибытие новых заявок
+        pending_requests = self.generate_requests()
+        self.airport.add_to_request_queue(pending_requests)
+
+        # смена состояния полос, распределение заявок и статистика
+        self.airport.process_time_tick()
+
+
+class BatchSimulationEngine:
+    """Движок, моделирующий сутки сразу в нескольких прогонах.
+
+    Прогоны одного аэропорта с разными отклонениями от расписания
+    считаются синхронно с фиксированным шагом: состояние полос, очередей
+    и поступивших заявок хранится в массивах numpy (прогон x полоса,
+    прогон x заявка), поэтому шаг всех прогонов стоит нескольких
+    векторных операций. Шаги совпадают с шагами SimulationEngine;
+    статистика за скользящее окно и список совершенных рейсов не ведутся.
+    """
+
+    def __init__(
+        self,
+        plane_types,
+        flight_schedule,
+        runway_count,
+        safety_time_gap,
+        schedule_variance,
+        time_tick,
+        start_time,
+        replications_count,
+        seed=None,
+    ):
+        if numpy is None:
+            raise ImportError('Для пакетного моделирования требуется numpy')
+        # входные параметры
+        self.runway_count = runway_count
+        self.safety_time_gap = safety_time_gap
+        self.schedule_variance = schedule_variance
+        self.time_tick = time_tick
+        self.start_time = start_time
+        self.replications_count = replications_count
+        self.rng = numpy.random.default_rng(seed)
+
+        # состояние модели
+        # прошедшее время в минутах
+        self.current_time = 0
+        # кол-во прошедших шагов
+        self.passed_time_ticks = 0
+        # продолжительность моделирования в минутах и шагах
+        self.duration = 24 * 60
+        self.last_time_tick = ceil(self.duration / self.time_tick)
+        # полосы всех прогонов
+        self.runways = RunwayBank(runway_count, replications_count)
+
+        # заявки прогонов в порядке поступления
+        self.create_requests(plane_types, flight_schedule)
+        # кол-во поступивших и назначенных на полосы заявок
+        self.released_counts = numpy.zeros(replications_count, numpy.int64)
+        self.dispatched_counts = numpy.zeros(
+            replications_count,
+            numpy.int64,
+        )
+        # момент назначения заявок на полосы
+        self.dispatch_times = numpy.zeros_like(self.flight_times)
+
+        # статистика прогонов
+        self.completed_requests = numpy.zeros(
+            replications_count,
+            numpy.int64,
+        )
+        self.max_landing_queue = numpy.zeros(replications_count, numpy.int64)
+        self.max_takeoff_queue = numpy.zeros(replications_count, numpy.int64)
+        self.total_landing_queue = numpy.zeros(
+            replications_count,
+            numpy.int64,
+        )
+        self.total_takeoff_queue = numpy.zeros(
+            replications_count,
+            numpy.int64,
+        )
+
+    def create_requests(self, plane_types, flight_schedule):
+        """Создает заявки всех прогонов с учетом отклонений.
+
+        Отклонения генерируются так же, как в
+        SimulationEngine.create_true_schedule_vectorized, но сразу для
+        всех прогонов.
+        """
+        min_variance, max_variance = self.schedule_variance
+        distribution_radius = (max_variance - min_variance) / 2
+        distribution_center = max_variance - distribution_radius
+        start_time = self.start_time[0] * 60 + self.start_time[1]
+        plane_type_names, service_time_table = (
+            plane_types.compile_service_times()
+        )
+        plane_type_codes = {
+            plane_type: code
+            for code, plane_type in enumerate(plane_type_names)
+        }
+
+        schedule = flight_schedule.get_schedule()
+        shape = (self.replications_count, len(schedule))
+        flight_times = numpy.array(
+            [flight[-1][0] * 60 + flight[-1][1] for flight in schedule],
+            dtype=numpy.int64,
+        ) - start_time
+        flight_times[flight_times < 0] += 24 * 60
+        is_takeoff = numpy.array(
+            [flight[1] == 'взлет' for flight in schedule],
+            dtype=bool,
+        )
+        service_times = numpy.array(
+            [
+                service_time_table[plane_type_codes[flight[0]]][
+                    REQUEST_TYPE_CODES[flight[1]]
+                ]
+                for flight in schedule
+            ],
+            dtype=numpy.int64,
+        )
+
+        random_variances = numpy.rint(
+            self.rng.standard_normal(shape) * distribution_radius / 3
+            + distribution_center
+        ).astype(numpy.int64)
+        numpy.clip(
+            random_variances,
+            min_variance,
+            max_variance,
+            out=random_variances,
+        )
+        is_negative = self.rng.integers(0, 2, size=shape).astype(bool)
+        random_variances[is_negative & ~is_takeoff] *= -1
+
+        # заявки каждого прогона упорядочены по времени подачи
+        flight_times = flight_times + random_variances
+        order = numpy.argsort(flight_times, axis=1, kind='stable')
+        self.flight_times = numpy.take_along_axis(flight_times, order, 1)
+        self.time_variances = numpy.take_along_axis(
+            random_variances,
+            order,
+            1,
+        )
+        self.is_takeoff = is_takeoff[order]
+        self.service_times = service_times[order]
+        # кол-во заявок на посадку среди первых i заявок прогона
+        self.landing_counts = numpy.zeros(
+            (self.replications_count, len(schedule) + 1),
+            dtype=numpy.int64,
+        )
+        numpy.cumsum(
+            ~self.is_takeoff,
+            axis=1,
+            out=self.landing_counts[:, 1:],
+        )
+
+        # кол-во заявок, поступивших к каждому шагу:
+        # заявки после последнего шага не поступают
+        release_ticks = numpy.maximum(
+            1,
+            -(-self.flight_times // self.time_tick),
+        )
+        numpy.minimum(
+            release_ticks,
+            self.last_time_tick + 1,
+            out=release_ticks,
+        )
+        ticks_count = self.last_time_tick + 2
+        release_counts = numpy.bincount(
+            (
+                numpy.arange(self.replications_count)[:, None] * ticks_count
+                + release_ticks
+            ).ravel(),
+            minlength=self.replications_count * ticks_count,
+        ).reshape(self.replications_count, ticks_count)
+        self.released_by_tick = numpy.cumsum(release_counts, axis=1)
+
+    def is_finished(self):
+        """Проверяет, закончено ли моделирование."""
+        return self.current_time >= self.duration
+
+    def step(self):
+        """Шаг моделирования всех прогонов."""
+        if self.is_finished():
+            return False
+        self.current_time += self.time_tick
+        self.passed_time_ticks += 1
+
+        # прибытие новых заявок
+        self.released_counts = self.released_by_tick[:, self.passed_time_ticks]
+        # шаг работы полос
+        finished = self.runways.advance(self.time_tick)
+        self.completed_requests += finished.sum(axis=1)
+        # распределяем заявки по свободным полосам в порядке их номеров
+        self.dispatch_requests()
+        # обновляем статистику по очередям
+        self.update_queue_stats()
+        return True
+
+    def run_to_end(self):
+        """Вычисляет все оставшиеся шаги моделирования."""
+        while self.step():
+            pass
+
+    def dispatch_requests(self):
+        """Назначает самые ранние заявки на свободные полосы."""
+        free = ~self.runways.busy
+        free_ranks = numpy.cumsum(free, axis=1)
+        dispatch_counts = numpy.minimum(
+            free_ranks[:, -1],
+            self.released_counts - self.dispatched_counts,
+        )
+        started = free & (free_ranks <= dispatch_counts[:, None])
+        if not started.any():
+            return
+        # k-я свободная полоса получает k-ю заявку очереди
+        request_indices = numpy.minimum(
+            self.dispatched_counts[:, None] + free_ranks - 1,
+            self.flight_times.shape[1] - 1,
+        )
+        self.runways.start_requests(
+            started,
+            numpy.take_along_axis(self.service_times, request_indices, 1),
+            self.safety_time_gap,
+        )
+        replication_indices = numpy.nonzero(started)[0]
+        self.dispatch_times[
+            replication_indices,
+            request_indices[started],
+        ] = self.current_time
+        self.dispatched_counts += dispatch_counts
+
+    def update_queue_stats(self):
+        """Обновляет статистику по очередям на В/П."""
+        landing_queue = (
+            self.landing_counts[
+                numpy.arange(self.replications_count),
+                self.released_counts,
+            ]
+            - self.landing_counts[
+                numpy.arange(self.replications_count),
+                self.dispatched_counts,
+            ]
+        )
+        takeoff_queue = (
+            self.released_counts - self.dispatched_counts - landing_queue
+        )
+        numpy.maximum(
+            self.max_landing_queue,
+            landing_queue,
+            out=self.max_landing_queue,
+        )
+        numpy.maximum(
+            self.max_takeoff_queue,
+            takeoff_queue,
+            out=self.max_takeoff_queue,
+        )
+        self.total_landing_queue += landing_queue
+        self.total_takeoff_queue += takeoff_queue
+
+    def get_delay_stats(self):
+        """Вычисляет максимальную и среднюю задержку заявок на взлет."""
+        request_indices = numpy.arange(self.flight_times.shape[1])
+        released = request_indices < self.released_counts[:, None]
+        dispatched = request_indices < self.dispatched_counts[:, None]
+        # заявки в очереди ждут до текущего момента времени
+        delays = (
+            self.time_variances
+            + numpy.where(dispatched, self.dispatch_times, self.current_time)
+            - self.flight_times
+        )
+        counted = released & self.is_takeoff
+        takeoff_counts = counted.sum(axis=1)
+        delays = numpy.where(counted, delays, 0)
+        max_delays = delays.max(axis=1, initial=0)
+        avg_delays = delays.sum(axis=1) / numpy.maximum(takeoff_counts, 1)
+        return max_delays, avg_delays
+
+    def get_stats(self):
+        """Возвращает статистику всех прогонов: массивы по прогонам."""
+        passed_time_ticks = max(1, self.passed_time_ticks)
+        max_delays, avg_delays = self.get_delay_stats()
+        if self.current_time:
+            runway_occupancy = (
+                self.runways.occupancy_times / self.current_time
+            )
+        else:
+            runway_occupancy = numpy.zeros(
+                (self.replications_count, self.runway_count),
+            )
+        return {
+            'completed_requests': self.completed_requests,
+            'max_delay': max_delays,
+            'avg_delay': avg_delays,
+            'max_landing_queue': self.max_landing_queue,
+            'max_takeoff_queue': self.max_takeoff_queue,
+            'avg_landing_queue': self.total_landing_queue / passed_time_ticks,
+            'avg_takeoff_queue': self.total_takeoff_queue / passed_time_ticks,
+            'runway_occupancy': runway_occupancy,
+        }
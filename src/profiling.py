@@ -0,0 +1,152 @@
+import cProfile
+from io import StringIO
+import json
+import pstats
+import time
+
+
+# этапы шага моделирования: (имя этапа, владелец метода, имя метода);
+# Airport.time_tick вызывает process_time_tick, поэтому замеряется
+# последний - он же вызывается событийным движком напрямую
+ENGINE_PHASES = (
+    ('generate_requests', 'engine', 'generate_requests'),
+    ('add_to_request_queue', 'airport', 'add_to_request_queue'),
+    ('airport_time_tick', 'airport', 'process_time_tick'),
+)
+
+
+class PhaseHistogram:
+    """Гистограмма длительностей этапа.
+
+    Длительности в наносекундах раскладываются по интервалам степеней
+    двойки: номер интервала == кол-во двоичных разрядов длительности.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Сбрасывает замеры."""
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+        # номер интервала -> кол-во замеров
+        self.buckets = {}
+
+    def add(self, duration_ns):
+        """Учитывает длительность одного вызова."""
+        self.count += 1
+        self.total_ns += duration_ns
+        if self.min_ns is None or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        bucket = duration_ns.bit_length()
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def get_percentile(self, fraction):
+        """Оценивает процентиль сверху: граница интервала гистограммы."""
+        if not self.count:
+            return 0
+        needed_count = fraction * self.count
+        passed_count = 0
+        for bucket in sorted(self.buckets):
+            passed_count += self.buckets[bucket]
+            if passed_count >= needed_count:
+                return min(self.max_ns, 2 ** bucket - 1)
+        return self.max_ns
+
+    def to_dict(self):
+        """Возвращает гистограмму в виде, пригодном для JSON."""
+        return {
+            'count': self.count,
+            'total_ns': self.total_ns,
+            'mean_ns': self.total_ns / self.count if self.count else 0,
+            'min_ns': self.min_ns or 0,
+            'max_ns': self.max_ns,
+            'p50_ns': self.get_percentile(0.5),
+            'p95_ns': self.get_percentile(0.95),
+            # верхняя граница интервала -> кол-во замеров
+            'buckets': {
+                str(2 ** bucket - 1): count
+                for bucket, count in sorted(self.buckets.items())
+            },
+        }
+
+
+class PhaseProfiler:
+    """Замер длительности этапов моделирования.
+
+    Замеряемые методы подменяются на уровне объекта обертками с
+    perf_counter_ns; detach удаляет обертки, после чего вызовы снова
+    идут напрямую в методы класса и замеры ничего не стоят.
+    """
+
+    def __init__(self):
+        # имя этапа -> гистограмма длительностей
+        self.histograms = {}
+        # подмененные методы: (объект, имя метода)
+        self.attached_methods = []
+
+    def attach(self, owner, method_name, phase=None):
+        """Начинает замерять метод объекта как этап phase."""
+        phase = phase or method_name
+        histogram = self.histograms.setdefault(phase, PhaseHistogram())
+        method = getattr(owner, method_name)
+        perf_counter_ns = time.perf_counter_ns
+
+        def timed_method(*args, **kwargs):
+            start_time = perf_counter_ns()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                histogram.add(perf_counter_ns() - start_time)
+
+        setattr(owner, method_name, timed_method)
+        self.attached_methods.append((owner, method_name))
+
+    def attach_engine(self, engine):
+        """Начинает замерять этапы шага движка моделирования."""
+        owners = {'engine': engine, 'airport': engine.airport}
+        for phase, owner_name, method_name in ENGINE_PHASES:
+            self.attach(owners[owner_name], method_name, phase)
+
+    def detach(self):
+        """Прекращает замеры, возвращая исходные методы."""
+        for owner, method_name in reversed(self.attached_methods):
+            delattr(owner, method_name)
+        self.attached_methods = []
+
+    def reset(self):
+        """Сбрасывает накопленные замеры."""
+        for histogram in self.histograms.values():
+            histogram.clear()
+
+    def get_stats(self):
+        """Возвращает замеры всех этапов."""
+        return {
+            phase: histogram.to_dict()
+            for phase, histogram in self.histograms.items()
+        }
+
+    def dump(self, file_path):
+        """Сохраняет замеры в файл JSON."""
+        with open(file_path, 'w', encoding='utf-8') as output_file:
+            json.dump(self.get_stats(), output_file, indent=2)
+
+
+def profile_call(function, file_path=None, lines_count=30):
+    """Вызывает функцию под cProfile.
+
+    Если задан file_path, сохраняет статистику для pstats; возвращает
+    текст с самыми затратными по суммарному времени функциями.
+    """
+    profile = cProfile.Profile()
+    profile.runcall(function)
+    if file_path:
+        profile.dump_stats(file_path)
+    stats_stream = StringIO()
+    stats = pstats.Stats(profile, stream=stats_stream)
+    stats.sort_stats('cumulative').print_stats(lines_count)
+    return stats_stream.getvalue()
@@ -0,0 +1,250 @@
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from math import sqrt
+from random import Random
+from statistics import NormalDist, fmean, stdev
+
+from models import (
+    BatchSimulationEngine,
+    EventSimulationEngine,
+    PlaneTypes,
+    Schedule,
+)
+
+
+# показатели одного прогона, по которым собирается статистика
+METRICS = (
+    'completed_requests',
+    'max_delay',
+    'avg_delay',
+    'max_landing_queue',
+    'max_takeoff_queue',
+    'avg_landing_queue',
+    'avg_takeoff_queue',
+)
+# минимальное кол-во прогонов: отклонение по одному прогону не определено
+MIN_REPLICATIONS_COUNT = 2
+
+
+def run_replication(plane_types, flight_schedule, parameters, seed):
+    """Моделирует одни сутки и возвращает итоговые показатели."""
+    engine = EventSimulationEngine(
+        plane_types,
+        flight_schedule,
+        parameters['runway_count'],
+        parameters['safety_time_gap'],
+        parameters['schedule_variance'],
+        parameters['time_tick'],
+        parameters['start_time'],
+        seed=seed,
+        vectorized=parameters.get('vectorized', False),
+    )
+    engine.run_to_end()
+    stats = engine.get_stats()
+    result = {metric: stats[metric] for metric in METRICS}
+    result['runway_occupancy'] = stats['runway_occupancy']
+    return result
+
+
+def run_replication_batch(plane_types, flight_schedule, parameters, seeds):
+    """Моделирует несколько суток подряд в одном процессе."""
+    return [
+        run_replication(plane_types, flight_schedule, parameters, seed)
+        for seed in seeds
+    ]
+
+
+def check_replications_count(replications_count):
+    """Проверяет, что прогонов хватает для отклонения и интервала."""
+    if replications_count < MIN_REPLICATIONS_COUNT:
+        raise ValueError(
+            f'Нужно не меньше {MIN_REPLICATIONS_COUNT} прогонов, '
+            f'получено {replications_count}'
+        )
+
+
+def summarize(values, confidence):
+    """Вычисляет среднее, отклонение и доверительный интервал."""
+    mean = fmean(values)
+    std = stdev(values)
+    radius = (
+        NormalDist().inv_cdf((1 + confidence) / 2) * std / sqrt(len(values))
+    )
+    return {
+        'mean': mean,
+        'std': std,
+        'ci': (mean - radius, mean + radius),
+    }
+
+
+def aggregate_results(results, confidence=0.95):
+    """Собирает статистику по результатам независимых прогонов."""
+    check_replications_count(len(results))
+    summary = {
+        metric: summarize([result[metric] for result in results], confidence)
+        for metric in METRICS
+    }
+    runway_count = len(results[0]['runway_occupancy'])
+    summary['runway_occupancy'] = [
+        summarize(
+            [result['runway_occupancy'][i] for result in results],
+            confidence,
+        )
+        for i in range(runway_count)
+    ]
+    summary['replications_count'] = len(results)
+    return summary
+
+
+def run_replications(
+    plane_types,
+    flight_schedule,
+    parameters,
+    replications_count,
+    seed=None,
+    max_workers=None,
+    batch_size=100,
+    confidence=0.95,
+):
+    """Моделирует независимые сутки в пуле процессов.
+
+    parameters - словарь с ключами runway_count, safety_time_gap,
+    schedule_variance, time_tick, start_time (как у SimulationEngine) и
+    необязательным vectorized.
+    Прогоны раздаются процессам пачками по batch_size, чтобы расходы на
+    передачу данных между процессами не превышали стоимость моделирования.
+    """
+    check_replications_count(replications_count)
+    seed_generator = Random(seed)
+    seeds = [seed_generator.getrandbits(64) for _ in range(replications_count)]
+    seed_batches = [
+        seeds[i:i + batch_size] for i in range(0, len(seeds), batch_size)
+    ]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        batch_results = executor.map(
+            run_replication_batch,
+            [plane_types] * len(seed_batches),
+            [flight_schedule] * len(seed_batches),
+            [parameters] * len(seed_batches),
+            seed_batches,
+        )
+        for batch_result in batch_results:
+            results.extend(batch_result)
+    return aggregate_results(results, confidence)
+
+
+def run_lockstep_replications(
+    plane_types,
+    flight_schedule,
+    parameters,
+    replications_count,
+    seed=None,
+    batch_size=1000,
+    confidence=0.95,
+):
+    """Моделирует независимые сутки синхронно в одном процессе.
+
+    Прогоны считаются пачками по batch_size в BatchSimulationEngine:
+    шаг всей пачки - несколько векторных операций numpy, а память
+    под заявки растет пропорционально batch_size.
+    """
+    check_replications_count(replications_count)
+    seed_generator = Random(seed)
+    results = []
+    for first_index in range(0, replications_count, batch_size):
+        engine = BatchSimulationEngine(
+            plane_types,
+            flight_schedule,
+            parameters['runway_count'],
+            parameters['safety_time_gap'],
+            parameters['schedule_variance'],
+            parameters['time_tick'],
+            parameters['start_time'],
+            min(batch_size, replications_count - first_index),
+            seed=seed_generator.getrandbits(64),
+        )
+        engine.run_to_end()
+        stats = engine.get_stats()
+        batch_stats = {
+            metric: stats[metric].tolist() for metric in METRICS
+        }
+        batch_stats['runway_occupancy'] = stats['runway_occupancy'].tolist()
+        for i in range(engine.replications_count):
+            results.append({
+                metric: values[i] for metric, values in batch_stats.items()
+            })
+    return aggregate_results(results, confidence)
+
+
+def main():
+    """Запуск серии прогонов на дефолтных настройках из командной строки."""
+    parser = ArgumentParser(description='Серия независимых прогонов модели.')
+    parser.add_argument('-n', '--replications', type=int, default=1000)
+    parser.add_argument('--runways', type=int, default=2)
+    parser.add_argument('--gap', type=int, default=1)
+    parser.add_argument('--min-variance', type=int, default=0)
+    parser.add_argument('--max-variance', type=int, default=120)
+    parser.add_argument('--step', type=int, default=5)
+    parser.add_argument('--start', default='00:00')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument(
+        '--lockstep',
+        action='store_true',
+        help='синхронные прогоны в одном процессе (требуется numpy)',
+    )
+    args = parser.parse_args()
+    if args.replications < MIN_REPLICATIONS_COUNT:
+        parser.error(
+            f'--replications: нужно не меньше {MIN_REPLICATIONS_COUNT}'
+        )
+
+    plane_types = PlaneTypes()
+    plane_types.use_default_settings()
+    flight_schedule = Schedule()
+    flight_schedule.use_default_settings(plane_types)
+    start_hours, start_minutes = args.start.split(':')
+    parameters = {
+        'runway_count': args.runways,
+        'safety_time_gap': args.gap,
+        'schedule_variance': (args.min_variance, args.max_variance),
+        'time_tick': args.step,
+        'start_time': (int(start_hours), int(start_minutes)),
+    }
+
+    if args.lockstep:
+        summary = run_lockstep_replications(
+            plane_types,
+            flight_schedule,
+            parameters,
+            args.replications,
+            seed=args.seed,
+        )
+    else:
+        summary = run_replications(
+            plane_types,
+            flight_schedule,
+            parameters,
+            args.replications,
+            seed=args.seed,
+            max_workers=args.workers,
+        )
+    print(f'прогонов: {summary["replications_count"]}')
+    for metric in METRICS:
+        metric_summary = summary[metric]
+        print(
+            f'{metric}: {metric_summary["mean"]:.3f} '
+            f'± {metric_summary["std"]:.3f} '
+            f'[{metric_summary["ci"][0]:.3f}; {metric_summary["ci"][1]:.3f}]'
+        )
+    for i, runway_summary in enumerate(summary['runway_occupancy']):
+        print(
+            f'runway_occupancy[{i}]: {runway_summary["mean"]:.3f} '
+            f'± {runway_summary["std"]:.3f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
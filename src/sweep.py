@@ -0,0 +1,218 @@
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import csv
+from itertools import product
+from random import Random
+import sys
+
+from models import EventSimulationEngine, PlaneTypes, Schedule
+
+
+# столбцы таблицы результатов
+COLUMNS = (
+    'runway_count',
+    'safety_time_gap',
+    'min_variance',
+    'max_variance',
+    'time_tick',
+    'seed',
+    'terminated',
+    'simulated_time',
+    'completed_requests',
+    'max_delay',
+    'avg_delay',
+    'max_landing_queue',
+    'max_takeoff_queue',
+    'avg_landing_queue',
+    'avg_takeoff_queue',
+    'avg_runway_occupancy',
+)
+
+
+def build_grid(
+    runway_counts, safety_time_gaps, schedule_variances, time_ticks
+):
+    """Строит все сочетания параметров модели."""
+    grid = product(
+        runway_counts,
+        safety_time_gaps,
+        schedule_variances,
+        time_ticks,
+    )
+    configurations = []
+    for runway_count, safety_time_gap, schedule_variance, time_tick in grid:
+        configurations.append({
+            'runway_count': runway_count,
+            'safety_time_gap': safety_time_gap,
+            'schedule_variance': schedule_variance,
+            'time_tick': time_tick,
+        })
+    return configurations
+
+
+def run_configuration(
+    plane_types,
+    flight_schedule,
+    parameters,
+    start_time,
+    seed,
+    max_delay_threshold=None,
+    check_interval=60,
+):
+    """Моделирует сутки для одного набора параметров.
+
+    Если задан max_delay_threshold, каждые check_interval минут
+    проверяется максимальная задержка; набор, уже превысивший порог,
+    дальше не считается.
+    """
+    engine = EventSimulationEngine(
+        plane_types,
+        flight_schedule,
+        parameters['runway_count'],
+        parameters['safety_time_gap'],
+        parameters['schedule_variance'],
+        parameters['time_tick'],
+        start_time,
+        seed=seed,
+    )
+    terminated = False
+    if max_delay_threshold is None:
+        engine.run_to_end()
+    else:
+        while not engine.is_finished():
+            engine.run_until(engine.current_time + check_interval)
+            # максимальная задержка со временем только растет
+            if engine.get_stats()['max_delay'] > max_delay_threshold:
+                terminated = not engine.is_finished()
+                break
+
+    stats = engine.get_stats()
+    runway_occupancy = stats['runway_occupancy']
+    return {
+        'runway_count': parameters['runway_count'],
+        'safety_time_gap': parameters['safety_time_gap'],
+        'min_variance': parameters['schedule_variance'][0],
+        'max_variance': parameters['schedule_variance'][1],
+        'time_tick': parameters['time_tick'],
+        'seed': seed,
+        'terminated': terminated,
+        'simulated_time': engine.current_time,
+        'completed_requests': stats['completed_requests'],
+        'max_delay': stats['max_delay'],
+        'avg_delay': stats['avg_delay'],
+        'max_landing_queue': stats['max_landing_queue'],
+        'max_takeoff_queue': stats['max_takeoff_queue'],
+        'avg_landing_queue': stats['avg_landing_queue'],
+        'avg_takeoff_queue': stats['avg_takeoff_queue'],
+        'avg_runway_occupancy': sum(runway_occupancy) / len(runway_occupancy),
+    }
+
+
+def run_sweep(
+    plane_types,
+    flight_schedule,
+    configurations,
+    start_time=(0, 0),
+    seeds_count=1,
+    seed=None,
+    max_delay_threshold=None,
+    max_workers=None,
+):
+    """Моделирует наборы параметров в пуле процессов.
+
+    Результаты отдаются по мере готовности, не дожидаясь всего перебора.
+    Каждый набор моделируется seeds_count раз с разными зернами; зерна
+    общие для всех наборов, чтобы наборы сравнивались на одних и тех же
+    отклонениях от расписания.
+    """
+    seed_generator = Random(seed)
+    seeds = [seed_generator.getrandbits(64) for _ in range(seeds_count)]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                run_configuration,
+                plane_types,
+                flight_schedule,
+                parameters,
+                start_time,
+                run_seed,
+                max_delay_threshold,
+            )
+            for parameters in configurations
+            for run_seed in seeds
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def parse_variance(value):
+    """Разбирает диапазон отклонения в формате min:max."""
+    min_variance, max_variance = value.split(':')
+    return int(min_variance), int(max_variance)
+
+
+def main():
+    """Запуск перебора параметров из командной строки."""
+    parser = ArgumentParser(description='Перебор параметров модели.')
+    parser.add_argument('--runways', type=int, nargs='+', default=[2])
+    parser.add_argument('--gap', type=int, nargs='+', default=[1])
+    parser.add_argument(
+        '--variance',
+        type=parse_variance,
+        nargs='+',
+        default=[(0, 120)],
+        help='диапазоны отклонения в формате min:max',
+    )
+    parser.add_argument('--step', type=int, nargs='+', default=[5])
+    parser.add_argument('--start', default='00:00')
+    parser.add_argument('--seeds', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument(
+        '--max-delay',
+        type=float,
+        default=None,
+        help='порог максимальной задержки для досрочной остановки',
+    )
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--csv', default=None, help='файл для результатов')
+    args = parser.parse_args()
+
+    plane_types = PlaneTypes()
+    plane_types.use_default_settings()
+    flight_schedule = Schedule()
+    flight_schedule.use_default_settings(plane_types)
+    start_hours, start_minutes = args.start.split(':')
+    configurations = build_grid(
+        args.runways,
+        args.gap,
+        args.variance,
+        args.step,
+    )
+
+    output_file = open(args.csv, 'w', newline='') if args.csv else sys.stdout
+    try:
+        writer = csv.DictWriter(
+            output_file,
+            fieldnames=COLUMNS,
+            delimiter=',' if args.csv else '\t',
+        )
+        writer.writeheader()
+        for result in run_sweep(
+            plane_types,
+            flight_schedule,
+            configurations,
+            start_time=(int(start_hours), int(start_minutes)),
+            seeds_count=args.seeds,
+            seed=args.seed,
+            max_delay_threshold=args.max_delay,
+            max_workers=args.workers,
+        ):
+            writer.writerow(result)
+            output_file.flush()
+    finally:
+        if output_file is not sys.stdout:
+            output_file.close()
+
+
+if __name__ == '__main__':
+    main()